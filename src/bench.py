@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+import os
+
+from cli.commands import register_builtin_commands
+from cli.registry import (
+    PLUGINS_ENV_VAR,
+    create_parser,
+    load_plugins,
+    run_command,
+)
+
+
+def main(argv: list[str] | None = None) -> None:
+    register_builtin_commands()
+    load_plugins(os.environ.get(PLUGINS_ENV_VAR, ""))
+    args = create_parser("bench").parse_args(argv)
+    run_command(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import argparse
+
+from cli import options, ramp_options, run_options, sql_options
+from connection.constants import DEFAULT_HTTP_PORT, DEFAULT_ORACLEDB_PORT
+from oracle_db.constants import FETCH_STRATEGY_NAMES, SYNC_MODE, WORKLOAD_MODES
+
+SOCKET_COMMAND = "socket"
+TNSPING_COMMAND = "tnsping"
+SQL_COMMAND = "sql"
+SQL_SINGLE_COMMAND = "sql-single"
+FETCH_COMMAND = "fetch"
+STARTUP_COMMAND = "startup"
+HARNESS_COMMAND = "selfbench"
+HISTORY_COMMAND = "history"
+WORKER_COMMAND = "worker"
+COORDINATOR_COMMAND = "coordinate"
+
+SOCKET_DESCRIPTION = "Measure network latency to a host"
+TNSPING_DESCRIPTION = "Measure TNS ping latency to an Oracle listener"
+SQL_DESCRIPTION = "Measure SQL query time"
+SQL_SINGLE_DESCRIPTION = "Measure a single SQL query execution"
+FETCH_DESCRIPTION = "Measure fetch throughput and memory per fetch strategy"
+STARTUP_DESCRIPTION = "Measure the cold start time of the bench command"
+HARNESS_DESCRIPTION = "Benchmark the harness itself against local stand-in servers"
+HISTORY_DESCRIPTION = "Show latency trends of stored runs per target"
+WORKER_DESCRIPTION = "Serve workloads of a load generation coordinator"
+COORDINATOR_DESCRIPTION = "Run a workload on several workers and merge their results"
+
+
+def configure_socket_arguments(parser: argparse.ArgumentParser) -> None:
+    options.add_host_arguments(parser, DEFAULT_HTTP_PORT)
+    options.add_count_argument(parser)
+    options.add_timeout_argument(parser)
+    options.add_wait_argument(parser)
+    run_options.add_client_stall_arguments(parser)
+    run_options.add_history_arguments(parser)
+    ramp_options.add_ramp_arguments(parser)
+
+
+def configure_tnsping_arguments(parser: argparse.ArgumentParser) -> None:
+    options.add_host_arguments(parser, DEFAULT_ORACLEDB_PORT)
+    options.add_count_argument(parser)
+    options.add_timeout_argument(parser)
+    options.add_wait_argument(parser)
+    parser.add_argument(
+        "-i",
+        "--include-conn-setup",
+        action="store_true",
+        default=False,
+        help="Include the connection setup before sending the ping into the measurement? (default: False)",
+    )
+    run_options.add_client_stall_arguments(parser)
+    run_options.add_history_arguments(parser)
+
+
+def configure_sql_arguments(parser: argparse.ArgumentParser) -> None:  # noqa: WPS213
+    options.add_db_arguments(parser)
+    options.add_count_argument(parser)
+    options.add_timeout_argument(parser)
+    options.add_wait_argument(parser)
+    sql_options.add_fetchmany_batch_size_argument(parser)
+    sql_options.add_sql_file_argument(parser)
+    sql_options.add_hard_parse_argument(parser)
+    parser.add_argument(
+        "-r",
+        "--reuse-connection",
+        action="store_true",
+        default=False,
+        help="Reuse the connection and cursor for all queries (default: False)?",
+    )
+    parser.add_argument(
+        "-wc",
+        "--warmup-cache",
+        type=int,
+        default=0,
+        help="How many times the query(ies) will be executed upfront the real test to warmup caches (default: 0)?",
+    )
+    parser.add_argument(
+        "-m",
+        "--mode",
+        choices=WORKLOAD_MODES,
+        default=SYNC_MODE,
+        help=(
+            "sync: per statement timing on a sync connection, async: whole script on "
+            + "async connections, pipeline: whole script as one pipeline, compare: "  # noqa: W503
+            + "sync vs async vs pipeline on reused connections (default: sync)"  # noqa: W503
+        ),
+    )
+    parser.add_argument(
+        "-co",
+        "--coroutines",
+        type=int,
+        default=1,
+        help="Number of coroutines with their own connection in async and pipeline mode (default: 1)",
+    )
+    parser.add_argument(
+        "-rt",
+        "--count-round-trips",
+        action="store_true",
+        default=False,
+        help="Count v$mystat round trips in async, pipeline, compare mode and with --probe-network (default: False)",
+    )
+    sql_options.add_network_probe_arguments(parser)
+    run_options.add_client_stall_arguments(parser)
+    run_options.add_history_arguments(parser)
+    ramp_options.add_ramp_arguments(parser)
+
+
+def configure_sql_single_arguments(parser: argparse.ArgumentParser) -> None:
+    options.add_db_arguments(parser)
+    options.add_timeout_argument(parser)
+    sql_options.add_fetchmany_batch_size_argument(parser)
+    sql_options.add_sql_file_argument(parser)
+    sql_options.add_hard_parse_argument(parser)
+
+
+def configure_fetch_arguments(parser: argparse.ArgumentParser) -> None:
+    options.add_db_arguments(parser)
+    options.add_count_argument(parser, "Number of measurements to take per strategy")
+    options.add_timeout_argument(parser)
+    options.add_wait_argument(parser)
+    parser.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=100,
+        help="Array size and batch size for fetchmany() (default: 100)",
+    )
+    parser.add_argument(
+        "-s",
+        "--strategies",
+        nargs="+",
+        choices=FETCH_STRATEGY_NAMES,
+        default=list(FETCH_STRATEGY_NAMES),
+        help=(
+            "Fetch strategies to compare: fetchall, fetchmany (LOB locators are read), "
+            + "inline-lobs (LOBs as strings/bytes via an output type handler), "  # noqa: W503
+            + "drain (count rows only) (default: all)"  # noqa: W503
+        ),
+    )
@@ -0,0 +1,70 @@
+from cli import arguments, distributed_arguments, tool_arguments
+from cli.registry import Command, register_command
+
+BUILTIN_COMMANDS = (
+    Command(
+        arguments.SOCKET_COMMAND,
+        arguments.SOCKET_DESCRIPTION,
+        arguments.configure_socket_arguments,
+        "socket_benchmark:run",
+    ),
+    Command(
+        arguments.TNSPING_COMMAND,
+        arguments.TNSPING_DESCRIPTION,
+        arguments.configure_tnsping_arguments,
+        "oracle_tnsping_benchmark:run",
+    ),
+    Command(
+        arguments.SQL_COMMAND,
+        arguments.SQL_DESCRIPTION,
+        arguments.configure_sql_arguments,
+        "oracle_sql_benchmark:run",
+    ),
+    Command(
+        arguments.SQL_SINGLE_COMMAND,
+        arguments.SQL_SINGLE_DESCRIPTION,
+        arguments.configure_sql_single_arguments,
+        "oracle_sql_benchmark_single_command:run",
+    ),
+    Command(
+        arguments.FETCH_COMMAND,
+        arguments.FETCH_DESCRIPTION,
+        arguments.configure_fetch_arguments,
+        "oracle_fetch_benchmark:run",
+    ),
+    Command(
+        arguments.STARTUP_COMMAND,
+        arguments.STARTUP_DESCRIPTION,
+        tool_arguments.configure_startup_arguments,
+        "startup_benchmark:run",
+    ),
+    Command(
+        arguments.HARNESS_COMMAND,
+        arguments.HARNESS_DESCRIPTION,
+        tool_arguments.configure_harness_arguments,
+        "harness_benchmark:run",
+    ),
+    Command(
+        arguments.HISTORY_COMMAND,
+        arguments.HISTORY_DESCRIPTION,
+        tool_arguments.configure_history_arguments,
+        "run_history:run",
+    ),
+    Command(
+        arguments.WORKER_COMMAND,
+        arguments.WORKER_DESCRIPTION,
+        distributed_arguments.configure_worker_arguments,
+        "distributed_worker:run",
+    ),
+    Command(
+        arguments.COORDINATOR_COMMAND,
+        arguments.COORDINATOR_DESCRIPTION,
+        distributed_arguments.configure_coordinator_arguments,
+        "distributed_benchmark:run",
+    ),
+)
+
+
+def register_builtin_commands() -> None:
+    for command in BUILTIN_COMMANDS:
+        register_command(command)
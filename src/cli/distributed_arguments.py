@@ -0,0 +1,112 @@
+import argparse
+
+from cli import options
+from connection.constants import DEFAULT_HTTP_PORT, DEFAULT_ORACLEDB_PORT
+from distributed.constants import (
+    DEFAULT_REPORT_EVERY,
+    DEFAULT_START_DELAY,
+    DEFAULT_WORKER_HOST,
+    DEFAULT_WORKER_PORT,
+    SOCKET_WORKLOAD,
+    TOKEN_ENV_VAR,
+    WORKLOAD_NAMES,
+)
+
+
+def configure_worker_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-l",
+        "--listen-host",
+        type=str,
+        default=DEFAULT_WORKER_HOST,
+        help=options.default_help(
+            "Address to listen on for the coordinator",
+            DEFAULT_WORKER_HOST,
+        ),
+    )
+    parser.add_argument(
+        "-p",
+        "--port",
+        type=int,
+        default=DEFAULT_WORKER_PORT,
+        help=options.default_help(
+            "Port to listen on, 0 picks a free one",
+            DEFAULT_WORKER_PORT,
+        ),
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        default=False,
+        help="Exit after serving one coordinator (default: False)",
+    )
+    parser.add_argument(
+        "--token",
+        type=str,
+        help=(
+            "Shared token coordinators have to send, required unless listening on "
+            + f"loopback (default: ${TOKEN_ENV_VAR})"  # noqa: W503
+        ),
+    )
+
+
+def add_worker_connection_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-wk",
+        "--workers",
+        nargs="+",
+        default=[],
+        help=f"Worker addresses as host or host:port (default port: {DEFAULT_WORKER_PORT})",
+    )
+    parser.add_argument(
+        "-lw",
+        "--local-workers",
+        type=int,
+        default=0,
+        help="Number of worker processes to start on this host (default: 0)",
+    )
+    parser.add_argument(
+        "--token",
+        type=str,
+        help=f"Shared token of the workers (default: ${TOKEN_ENV_VAR})",
+    )
+
+
+def configure_coordinator_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "workload",
+        choices=WORKLOAD_NAMES,
+        help="Measurement every worker runs against the target",
+    )
+    parser.add_argument("host", type=str, help="Target hostname or IP address")
+    parser.add_argument(
+        "-p",
+        "--port",
+        type=int,
+        help=(
+            f"Target port number (default: {DEFAULT_HTTP_PORT} for {SOCKET_WORKLOAD}, "
+            + f"{DEFAULT_ORACLEDB_PORT} otherwise)"  # noqa: W503
+        ),
+    )
+    options.add_count_argument(parser, "Number of measurements per worker")
+    options.add_timeout_argument(parser)
+    options.add_wait_argument(parser)
+    add_worker_connection_arguments(parser)
+    parser.add_argument(
+        "--start-delay",
+        type=float,
+        default=DEFAULT_START_DELAY,
+        help=options.default_help(
+            "Seconds from sending the workload to the synchronized start",
+            DEFAULT_START_DELAY,
+        ),
+    )
+    parser.add_argument(
+        "--report-every",
+        type=int,
+        default=DEFAULT_REPORT_EVERY,
+        help=options.default_help(
+            "Measurements per streamed worker summary",
+            DEFAULT_REPORT_EVERY,
+        ),
+    )
@@ -0,0 +1,76 @@
+import argparse
+
+from connection.constants import DEFAULT_ORACLEDB_PORT
+
+DEFAULT_COUNT = 10
+DEFAULT_TIMEOUT = 2
+DEFAULT_WAIT = 0.5
+DEFAULT_QUERY = "SELECT SYSDATE FROM DUAL"
+
+
+def default_help(help_text: str, default_value: object) -> str:
+    return f"{help_text} (default: {default_value})"
+
+
+def add_host_arguments(parser: argparse.ArgumentParser, default_port: int) -> None:
+    parser.add_argument("host", type=str, help="Target hostname or IP address")
+    parser.add_argument(
+        "-p",
+        "--port",
+        type=int,
+        default=default_port,
+        help=default_help("Target port number", default_port),
+    )
+
+
+def add_db_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("db_host", type=str, help="Target hostname or IP address")
+    parser.add_argument("db_service", type=str, help="Service name of the target db")
+    parser.add_argument("db_user", type=str, help="DB username")
+    parser.add_argument(
+        "-q",
+        "--query",
+        type=str,
+        default=DEFAULT_QUERY,
+        help=default_help("The SQL statement to execute", DEFAULT_QUERY),
+    )
+    parser.add_argument(
+        "-p",
+        "--db-port",
+        type=int,
+        default=DEFAULT_ORACLEDB_PORT,
+        help=default_help("The port the DB is listening on", DEFAULT_ORACLEDB_PORT),
+    )
+
+
+def add_count_argument(
+    parser: argparse.ArgumentParser,
+    help_text: str = "Number of measurements to take",
+) -> None:
+    parser.add_argument(
+        "-c",
+        "--count",
+        type=int,
+        default=DEFAULT_COUNT,
+        help=default_help(help_text, DEFAULT_COUNT),
+    )
+
+
+def add_timeout_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help=default_help("Socket timeout in seconds", DEFAULT_TIMEOUT),
+    )
+
+
+def add_wait_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-w",
+        "--wait",
+        type=float,
+        default=DEFAULT_WAIT,
+        help=default_help("Wait time between each attempt", DEFAULT_WAIT),
+    )
@@ -0,0 +1,101 @@
+import argparse
+
+from cli.options import default_help
+from oracle_db.constants import SYNC_MODE
+
+DEFAULT_RAMP_START = 1
+DEFAULT_RAMP_STEP = 1
+DEFAULT_RAMP_MAX = 32
+DEFAULT_RAMP_HOLD = 10
+DEFAULT_RAMP_SETTLE = 2
+DEFAULT_MAX_ERROR_RATE = 0.01
+
+
+def positive_int(argument: str) -> int:
+    number = int(argument)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def add_ramp_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--ramp",
+        action="store_true",
+        default=False,
+        help=(
+            "Search the capacity knee by raising the concurrency step by step "
+            + "instead of a fixed count run (default: False)"  # noqa: W503
+        ),
+    )
+    parser.add_argument(
+        "--ramp-start",
+        type=positive_int,
+        default=DEFAULT_RAMP_START,
+        help=default_help("Concurrency of the first ramp step", DEFAULT_RAMP_START),
+    )
+    parser.add_argument(
+        "--ramp-step",
+        type=positive_int,
+        default=DEFAULT_RAMP_STEP,
+        help=default_help("Concurrency added per ramp step", DEFAULT_RAMP_STEP),
+    )
+    parser.add_argument(
+        "--ramp-max",
+        type=positive_int,
+        default=DEFAULT_RAMP_MAX,
+        help=default_help("Highest concurrency to ramp up to", DEFAULT_RAMP_MAX),
+    )
+    parser.add_argument(
+        "--ramp-hold",
+        type=float,
+        default=DEFAULT_RAMP_HOLD,
+        help=default_help("Seconds each ramp step is measured", DEFAULT_RAMP_HOLD),
+    )
+    parser.add_argument(
+        "--ramp-settle",
+        type=float,
+        default=DEFAULT_RAMP_SETTLE,
+        help=default_help(
+            "Seconds of each ramp step discarded before measuring",
+            DEFAULT_RAMP_SETTLE,
+        ),
+    )
+    parser.add_argument(
+        "--max-p99",
+        type=float,
+        help="Stop the ramp when the p99 latency in ms exceeds this (default: no limit)",
+    )
+    parser.add_argument(
+        "--max-error-rate",
+        type=float,
+        default=DEFAULT_MAX_ERROR_RATE,
+        help=default_help(
+            "Stop the ramp when the share of failed attempts exceeds this",
+            DEFAULT_MAX_ERROR_RATE,
+        ),
+    )
+
+
+def check_ramp_arguments(args: argparse.Namespace) -> None:
+    """Exit on ramps without any step and on options a ramp would ignore."""
+    ramp_checks = (
+        (args.ramp_start > args.ramp_max, "--ramp-start must not be above --ramp-max"),
+        (args.history_db, "--history-db is not supported with --ramp"),
+        (
+            getattr(args, "mode", SYNC_MODE) != SYNC_MODE,
+            f"--ramp only runs in {SYNC_MODE} mode",
+        ),
+        (
+            getattr(args, "probe_network", False),
+            "--probe-network is not supported with --ramp",
+        ),
+        (
+            args.detect_stalls or args.exclude_stalls,
+            "--detect-stalls and --exclude-stalls are not supported with --ramp",
+        ),
+    )
+    for rejected, ramp_error in ramp_checks:
+        if rejected:
+            print(f"Error: {ramp_error}")
+            exit(1)
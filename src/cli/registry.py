@@ -0,0 +1,66 @@
+import argparse
+import importlib
+from dataclasses import dataclass
+from typing import Callable
+
+PLUGINS_ENV_VAR = "BENCH_PLUGINS"
+PLUGINS_SEPARATOR = ","
+TARGET_SEPARATOR = ":"
+
+
+@dataclass(frozen=True)
+class Command:
+    """A `bench` subcommand.
+
+    `target` names the function that runs the command as "module:function". The
+    module is imported only when the command is chosen, so heavy dependencies like
+    oracledb stay out of the startup path of every other command.
+    """
+
+    name: str
+    description: str
+    configure: Callable[[argparse.ArgumentParser], None]
+    target: str
+
+
+_commands: dict[str, Command] = {}
+
+
+def register_command(command: Command) -> None:
+    if command.name in _commands:
+        raise ValueError(f"The command '{command.name}' is already registered.")
+    _commands[command.name] = command
+
+
+def registered_commands() -> list[Command]:
+    return list(_commands.values())
+
+
+def load_plugins(plugin_modules: str) -> None:
+    """Import comma separated plugin modules which register their own commands."""
+    for plugin_module in plugin_modules.split(PLUGINS_SEPARATOR):
+        if plugin_module.strip():
+            importlib.import_module(plugin_module.strip())
+
+
+def create_parser(prog: str) -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog=prog,
+        description="Latency benchmarks for networks and Oracle databases",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="command", required=True)
+    for command in _commands.values():
+        subparser = subparsers.add_parser(
+            command.name,
+            help=command.description,
+            description=command.description,
+        )
+        command.configure(subparser)
+        subparser.set_defaults(command_target=command.target)
+    return parser
+
+
+def run_command(args: argparse.Namespace) -> None:
+    module_name, function_name = args.command_target.split(TARGET_SEPARATOR)
+    command_function = getattr(importlib.import_module(module_name), function_name)
+    command_function(args)
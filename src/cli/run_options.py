@@ -0,0 +1,54 @@
+import argparse
+
+from cli.options import default_help
+from measurements.constants import DEFAULT_STALL_THRESHOLD, get_switch_interval
+
+
+def stall_threshold(argument: str) -> float:
+    threshold = float(argument)
+    if threshold <= get_switch_interval():
+        raise argparse.ArgumentTypeError(
+            f"must be above the GIL switch interval of {get_switch_interval()}ms",
+        )
+    return threshold
+
+
+def add_client_stall_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-ds",
+        "--detect-stalls",
+        action="store_true",
+        default=False,
+        help="Flag samples that coincide with client GC pauses or scheduling hiccups (default: False)",
+    )
+    parser.add_argument(
+        "-es",
+        "--exclude-stalls",
+        action="store_true",
+        default=False,
+        help="Exclude flagged samples from the results, implies --detect-stalls (default: False)",
+    )
+    parser.add_argument(
+        "--stall-threshold",
+        type=stall_threshold,
+        default=DEFAULT_STALL_THRESHOLD,
+        help=default_help(
+            "Client stall in ms that flags a sample",
+            DEFAULT_STALL_THRESHOLD,
+        ),
+    )
+
+
+def add_history_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-hd",
+        "--history-db",
+        type=str,
+        help="SQLite run history database to store the run in (default: not stored)",
+    )
+    parser.add_argument(
+        "--store-samples",
+        action="store_true",
+        default=False,
+        help="Store the raw samples in the run history as well (default: False)",
+    )
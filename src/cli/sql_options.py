@@ -0,0 +1,55 @@
+import argparse
+
+from cli.options import default_help
+from connection.constants import DEFAULT_PROBE_INTERVAL
+
+
+def add_fetchmany_batch_size_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-b",
+        "--batch-size",
+        type=int,
+        default=0,
+        help="The batch size for fetchmany(). If it is 0 fetchall is called (default: 0)",
+    )
+
+
+def add_sql_file_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-f",
+        "--file",
+        type=str,
+        help=("Path to an file that contains multiple SQL statements to execute"),
+    )
+
+
+def add_hard_parse_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-hp",
+        "--hard-parse",
+        action="store_true",
+        default=False,
+        help="Force hard parse (default: false)",
+    )
+
+
+def add_network_probe_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-pn",
+        "--probe-network",
+        action="store_true",
+        default=False,
+        help=(
+            "TNS ping the listener in the background and split each sync mode "
+            + "latency into network round trips and other time (default: False)"  # noqa: W503
+        ),
+    )
+    parser.add_argument(
+        "--probe-interval",
+        type=float,
+        default=DEFAULT_PROBE_INTERVAL,
+        help=default_help(
+            "Milliseconds between two background TNS pings",
+            DEFAULT_PROBE_INTERVAL,
+        ),
+    )
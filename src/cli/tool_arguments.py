@@ -0,0 +1,136 @@
+import argparse
+
+from cli import options
+from history.constants import BUCKET_SECONDS, DAY_BUCKET, STATEMENT_HISTORY_MODE
+from oracle_db.constants import ASYNC_MODE, PIPELINE_MODE, SYNC_MODE
+
+DEFAULT_STARTUP_BUDGET = 250
+DEFAULT_STARTUP_SCENARIOS = ("--help", "socket --help", "sql --help", "fetch --help")
+
+DEFAULT_HARNESS_SAMPLES = 1000000
+DEFAULT_HARNESS_STATEMENTS = 100000
+DEFAULT_HARNESS_COUNT = 1000
+DEFAULT_HARNESS_REPEAT = 5
+DEFAULT_HARNESS_TOLERANCE = 20
+
+DEFAULT_HISTORY_DAYS = 28
+
+
+def configure_startup_arguments(parser: argparse.ArgumentParser) -> None:
+    options.add_count_argument(parser, "Number of cold starts per scenario")
+    parser.add_argument(
+        "-bu",
+        "--budget",
+        type=float,
+        default=DEFAULT_STARTUP_BUDGET,
+        help=options.default_help(
+            "Maximum median cold start time in ms",
+            DEFAULT_STARTUP_BUDGET,
+        ),
+    )
+    parser.add_argument(
+        "-s",
+        "--scenarios",
+        nargs="+",
+        default=list(DEFAULT_STARTUP_SCENARIOS),
+        help=options.default_help(
+            "bench arguments to start with, quoted one per scenario",
+            ", ".join(DEFAULT_STARTUP_SCENARIOS),
+        ),
+    )
+
+
+def configure_harness_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--samples",
+        type=int,
+        default=DEFAULT_HARNESS_SAMPLES,
+        help=options.default_help(
+            "Samples for the statistics and stall monitor cases",
+            DEFAULT_HARNESS_SAMPLES,
+        ),
+    )
+    parser.add_argument(
+        "--statements",
+        type=int,
+        default=DEFAULT_HARNESS_STATEMENTS,
+        help=options.default_help(
+            "Statements in the parsed SQL script",
+            DEFAULT_HARNESS_STATEMENTS,
+        ),
+    )
+    options.add_count_argument(parser, "Requests per network and stub cursor case")
+    parser.set_defaults(count=DEFAULT_HARNESS_COUNT)
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=DEFAULT_HARNESS_REPEAT,
+        help=options.default_help(
+            "Runs per case, the median is kept",
+            DEFAULT_HARNESS_REPEAT,
+        ),
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        help="Stored results to compare against, regressions fail the run",
+    )
+    parser.add_argument(
+        "--save",
+        type=str,
+        help="Path to store the results as JSON for later comparisons",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_HARNESS_TOLERANCE,
+        help=options.default_help(
+            "Allowed slowdown per operation in percent",
+            DEFAULT_HARNESS_TOLERANCE,
+        ),
+    )
+
+
+def configure_history_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("history_db", type=str, help="SQLite run history database")
+    parser.add_argument(
+        "target",
+        type=str,
+        help="Target as stored by the tools, host:port or host:port/service",
+    )
+    parser.add_argument(
+        "-to",
+        "--tool",
+        type=str,
+        help="Only runs of this bench command, see --mode for sql runs (default: all)",
+    )
+    parser.add_argument(
+        "-m",
+        "--mode",
+        choices=[STATEMENT_HISTORY_MODE, SYNC_MODE, ASYNC_MODE, PIPELINE_MODE],
+        help=(
+            f"Only sql runs of this kind, {STATEMENT_HISTORY_MODE}: sync runs timed per "
+            + "statement, others: workload and compare runs timed per script (default: all)"  # noqa: W503
+        ),
+    )
+    parser.add_argument(
+        "-sh",
+        "--statement-hash",
+        type=str,
+        help="Only runs of the SQL statements with this hash (default: all)",
+    )
+    parser.add_argument(
+        "-d",
+        "--days",
+        type=float,
+        default=DEFAULT_HISTORY_DAYS,
+        help=options.default_help("How many days to look back", DEFAULT_HISTORY_DAYS),
+    )
+    parser.add_argument(
+        "-bk",
+        "--bucket",
+        choices=list(BUCKET_SECONDS),
+        default=DAY_BUCKET,
+        help=options.default_help("Time bucket to merge runs into", DAY_BUCKET),
+    )
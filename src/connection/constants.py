@@ -1,3 +1,4 @@
 DEFAULT_HTTP_PORT = 443
 DEFAULT_ORACLEDB_PORT = 1521
 DEFAULT_RECEIVE_BUFFER_SIZE = 4096
+DEFAULT_PROBE_INTERVAL = 100.0
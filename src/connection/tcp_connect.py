@@ -0,0 +1,22 @@
+import socket
+import time
+from contextlib import contextmanager
+from functools import partial
+from typing import Callable, Iterator
+
+
+def measure_connect_latency(host: str, port: int, timeout: float) -> float:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as socket_instance:
+        socket_instance.settimeout(timeout)
+        start_time = time.perf_counter()
+        socket_instance.connect((host, port))
+        return (time.perf_counter() - start_time) * 1000
+
+
+@contextmanager
+def open_connect_session(
+    host: str,
+    port: int,
+    timeout: float,
+) -> Iterator[Callable[[], float]]:
+    yield partial(measure_connect_latency, host, port, timeout)
@@ -0,0 +1,46 @@
+import re
+import socket
+import time
+
+from connection.constants import DEFAULT_RECEIVE_BUFFER_SIZE
+
+packet = (
+    b"\x00W\x00\x00\x01\x00\x00\x00\x018\x01,\x00\x00\x08\x00\x7f\xff"
+    + b"\x7f\x08\x00\x00\x01\x00\x00\x1d\x00:\x00\x00\x00\x00\x00\x00"  # noqa: W503
+    + b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x190\x00\x00\x00\x8d"  # noqa: W503
+    + b"\x00\x00\x00\x00\x00\x00\x00\x00(CONNECT_DATA=(COMMAND=ping))"  # noqa: W503
+)
+
+pattern = r"\(DESCRIPTION=\(TMP=\)\(VSNNUM=0\)\(ERR=0\)\(ALIAS=.*?\)\)"
+
+
+def measure_single_tns_ping(
+    host: str,
+    port: int,
+    timeout: float,
+    include_conn_setup: bool,
+) -> float:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as tcp_socket:
+        tcp_socket.settimeout(timeout)
+        received = "no data"
+
+        if include_conn_setup:
+            start_time = time.perf_counter()
+        tcp_socket.connect((host, port))
+        if not include_conn_setup:
+            start_time = time.perf_counter()
+
+        tcp_socket.send(packet)
+        while True:
+            received_data = tcp_socket.recv(DEFAULT_RECEIVE_BUFFER_SIZE)
+            if not received_data:
+                break
+            received = received_data[12:].decode()  # noqa: WPS432
+
+        end_time = time.perf_counter()
+        tcp_socket.close()
+
+        if not re.match(pattern, received):
+            raise ValueError(f"Wrong TNSPing answer received: {received}")
+
+        return (end_time - start_time) * 1000
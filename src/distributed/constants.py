@@ -0,0 +1,27 @@
+from types import MappingProxyType
+
+from connection.constants import DEFAULT_HTTP_PORT, DEFAULT_ORACLEDB_PORT
+
+SOCKET_WORKLOAD = "socket"
+TNSPING_WORKLOAD = "tnsping"
+WORKLOAD_NAMES = (SOCKET_WORKLOAD, TNSPING_WORKLOAD)
+WORKLOAD_DEFAULT_PORTS = MappingProxyType(
+    {
+        SOCKET_WORKLOAD: DEFAULT_HTTP_PORT,
+        TNSPING_WORKLOAD: DEFAULT_ORACLEDB_PORT,
+    },
+)
+
+DEFAULT_WORKER_HOST = "127.0.0.1"
+DEFAULT_WORKER_PORT = 7070
+DEFAULT_START_DELAY = 2.0
+DEFAULT_REPORT_EVERY = 10
+DEFAULT_SPEC_TIMEOUT = 10.0
+WORKER_READY_PREFIX = "Worker listening on"
+TOKEN_ENV_VAR = "BENCH_WORKER_TOKEN"  # noqa: S105
+LOCALHOST = "localhost"
+
+SPEC_MESSAGE = "spec"
+SUMMARY_MESSAGE = "summary"
+DONE_MESSAGE = "done"
+ERROR_MESSAGE = "error"
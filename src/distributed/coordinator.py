@@ -0,0 +1,129 @@
+import socket
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable
+
+from distributed.constants import (
+    DONE_MESSAGE,
+    ERROR_MESSAGE,
+    SPEC_MESSAGE,
+    SUMMARY_MESSAGE,
+)
+from distributed.protocol import (
+    Address,
+    Message,
+    WorkloadSpec,
+    format_address,
+    read_messages,
+    send_message,
+)
+from measurements.latency_histogram import LatencyHistogram
+from measurements.measurements_stats import MeasurementsStats
+
+
+@dataclass
+class NodeResult:
+    node: str
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    failed_attempts: int = 0
+    error: str | None = None
+    done: bool = False
+
+    @property
+    def measurements_stats(self) -> MeasurementsStats:
+        return MeasurementsStats.from_histogram(self.histogram, self.failed_attempts)
+
+
+def merge_node_results(node_results: list[NodeResult]) -> MeasurementsStats:
+    histogram = LatencyHistogram()
+    failed_attempts = 0
+    for node_result in node_results:
+        histogram.merge(node_result.histogram)
+        failed_attempts += node_result.failed_attempts
+    return MeasurementsStats.from_histogram(histogram, failed_attempts)
+
+
+def _apply_message(
+    node_result: NodeResult,
+    message: Message,
+    on_summary: Callable[[NodeResult], None],
+) -> bool:
+    """Apply a worker message to its node result, return if the worker finished."""
+    message_type = message["type"]
+    if message_type == SUMMARY_MESSAGE:
+        node_result.histogram.merge(LatencyHistogram.from_dict(message["histogram"]))
+        node_result.failed_attempts += message["failed_attempts"]
+        on_summary(node_result)
+    elif message_type == ERROR_MESSAGE:
+        node_result.error = message["error"]
+    elif message_type == DONE_MESSAGE:
+        node_result.done = True
+    return node_result.done or node_result.error is not None
+
+
+def _read_node(
+    connection: socket.socket,
+    node_result: NodeResult,
+    spec_message: Message,
+    on_summary: Callable[[NodeResult], None],
+) -> None:
+    with connection:
+        with connection.makefile("rw") as stream:
+            send_message(stream, spec_message)
+            for message in read_messages(stream):
+                if _apply_message(node_result, message, on_summary):
+                    return
+    node_result.error = "Connection closed before the workload finished"
+
+
+def _collect_node(
+    connection: socket.socket,
+    node_result: NodeResult,
+    spec_message: Message,
+    on_summary: Callable[[NodeResult], None],
+) -> None:
+    connection.settimeout(None)
+    try:
+        _read_node(connection, node_result, spec_message, on_summary)
+    except OSError as error:
+        node_result.error = str(error)
+
+
+def _connect_workers(
+    workers: list[Address],
+    connect_timeout: float,
+) -> list[socket.socket]:
+    connections: list[socket.socket] = []
+    try:
+        for worker in workers:
+            connections.append(socket.create_connection(worker, connect_timeout))
+    except OSError:
+        for connection in connections:
+            connection.close()
+        raise
+    return connections
+
+
+def run_distributed(
+    workers: list[Address],
+    spec: WorkloadSpec,
+    token: str,
+    connect_timeout: float,
+    on_summary: Callable[[NodeResult], None],
+) -> list[NodeResult]:
+    """Send the spec to every worker and merge the summaries each one streams back.
+
+    All workers are connected before the spec goes out, so none starts before the
+    others could be reached.
+    """
+    connections = _connect_workers(workers, connect_timeout)
+    node_results = [NodeResult(format_address(worker)) for worker in workers]
+    collect_node = partial(
+        _collect_node,
+        spec_message=Message(type=SPEC_MESSAGE, token=token, spec=spec),
+        on_summary=on_summary,
+    )
+    with ThreadPoolExecutor(max_workers=max(len(workers), 1)) as executor:
+        list(executor.map(collect_node, connections, node_results))
+    return node_results
@@ -0,0 +1,56 @@
+import os
+import subprocess  # noqa: S404
+import sys
+from contextlib import ExitStack, contextmanager
+from typing import Iterator
+
+from cli.arguments import WORKER_COMMAND
+from distributed.constants import TOKEN_ENV_VAR, WORKER_READY_PREFIX
+from distributed.protocol import Address, parse_address
+
+BENCH_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "bench.py",
+)
+LOCAL_WORKER_HOST = "127.0.0.1"
+
+
+@contextmanager
+def start_local_worker(token: str) -> Iterator["subprocess.Popen[str]"]:
+    process = subprocess.Popen(  # noqa: S603
+        [
+            sys.executable,
+            BENCH_SCRIPT,
+            WORKER_COMMAND,
+            "--listen-host",
+            LOCAL_WORKER_HOST,
+            "--port",
+            "0",
+            "--once",
+        ],
+        stdout=subprocess.PIPE,
+        text=True,
+        env={**os.environ, TOKEN_ENV_VAR: token},
+    )
+    try:
+        yield process
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def read_worker_address(process: "subprocess.Popen[str]") -> Address:
+    ready_line = process.stdout.readline() if process.stdout else ""
+    if not ready_line.startswith(WORKER_READY_PREFIX):
+        raise RuntimeError(f"Local worker did not start: {ready_line!r}")
+    return parse_address(ready_line.removeprefix(WORKER_READY_PREFIX).strip(), 0)
+
+
+@contextmanager
+def spawn_local_workers(count: int, token: str) -> Iterator[list[Address]]:
+    """Start `count` worker processes on free localhost ports that require `token`."""
+    with ExitStack() as stack:
+        processes = [
+            stack.enter_context(start_local_worker(token)) for _ in range(count)
+        ]
+        yield [read_worker_address(process) for process in processes]
@@ -0,0 +1,61 @@
+import ipaddress
+import json
+from typing import Iterator, TextIO, TypedDict
+
+from distributed.constants import LOCALHOST
+from measurements.latency_histogram import HistogramDict
+
+Address = tuple[str, int]
+
+
+class WorkloadSpec(TypedDict):
+    """Workload a worker runs, `start_at` is a Unix timestamp in seconds."""
+
+    workload: str
+    host: str
+    port: int
+    count: int
+    timeout: float
+    wait: float
+    report_every: int
+    start_at: float
+
+
+class Message(TypedDict, total=False):
+    """One JSON line between coordinator and worker, `type` tells the used keys."""
+
+    type: str
+    token: str
+    spec: WorkloadSpec
+    histogram: HistogramDict
+    failed_attempts: int
+    error: str
+
+
+def send_message(stream: TextIO, message: Message) -> None:
+    stream.write(f"{json.dumps(message)}\n")
+    stream.flush()
+
+
+def read_messages(stream: TextIO) -> Iterator[Message]:
+    for line in stream:
+        if line.strip():
+            yield json.loads(line)
+
+
+def parse_address(address: str, default_port: int) -> Address:
+    host, _, port = address.rpartition(":")
+    if not host:
+        return address, default_port
+    return host, int(port)
+
+
+def format_address(address: Address) -> str:
+    return f"{address[0]}:{address[1]}"
+
+
+def is_loopback(host: str) -> bool:
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return host == LOCALHOST
@@ -0,0 +1,148 @@
+import hmac
+import socket
+import time
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, Mapping, TextIO
+
+from connection.tcp_connect import measure_connect_latency
+from connection.tns_ping import measure_single_tns_ping
+from distributed.constants import (
+    DEFAULT_SPEC_TIMEOUT,
+    DONE_MESSAGE,
+    ERROR_MESSAGE,
+    SOCKET_WORKLOAD,
+    SPEC_MESSAGE,
+    SUMMARY_MESSAGE,
+    TNSPING_WORKLOAD,
+    WORKER_READY_PREFIX,
+)
+from distributed.protocol import (
+    Message,
+    WorkloadSpec,
+    format_address,
+    is_loopback,
+    read_messages,
+    send_message,
+)
+from measurements.latency_histogram import LatencyHistogram
+
+WORKLOADS: Mapping[str, Callable[[str, int, float], float]] = MappingProxyType(
+    {
+        SOCKET_WORKLOAD: measure_connect_latency,
+        TNSPING_WORKLOAD: partial(measure_single_tns_ping, include_conn_setup=False),
+    },
+)
+
+
+def measure_summary(measure: Callable[[], float], count: int, wait: float) -> Message:
+    histogram = LatencyHistogram()
+    failed_attempts = 0
+    for _ in range(count):
+        try:
+            latency = measure()
+        except Exception:
+            failed_attempts += 1
+        else:
+            histogram.record(latency)
+        time.sleep(wait)
+    return Message(
+        type=SUMMARY_MESSAGE,
+        histogram=histogram.to_dict(),
+        failed_attempts=failed_attempts,
+    )
+
+
+def run_workload(stream: TextIO, spec: WorkloadSpec) -> None:
+    """Run the workload from its synchronized start and stream partial summaries.
+
+    Every summary holds only the samples since the previous one, so the coordinator
+    merges them in any order. The start relies on the hosts' clocks being in sync.
+    """
+    workload = WORKLOADS[spec["workload"]]
+    measure = partial(workload, spec["host"], spec["port"], spec["timeout"])
+    time.sleep(max(spec["start_at"] - time.time(), 0))
+    for reported in range(0, spec["count"], spec["report_every"]):
+        count = min(spec["report_every"], spec["count"] - reported)
+        send_message(stream, measure_summary(measure, count, spec["wait"]))
+
+
+def is_authorized(message: Message, token: str | None) -> bool:
+    if token is None:
+        return True
+    return hmac.compare_digest(message.get("token", ""), token)
+
+
+def handle_coordinator(
+    connection: socket.socket,
+    stream: TextIO,
+    token: str | None,
+) -> None:
+    for message in read_messages(stream):
+        if message.get("type") != SPEC_MESSAGE:
+            continue
+        connection.settimeout(None)
+        if not is_authorized(message, token):
+            send_message(stream, Message(type=ERROR_MESSAGE, error="Invalid token"))
+            return
+        try:
+            run_workload(stream, message["spec"])
+        except Exception as error:
+            send_message(stream, Message(type=ERROR_MESSAGE, error=str(error)))
+        else:
+            send_message(stream, Message(type=DONE_MESSAGE))
+        return
+
+
+def handle_connection(connection: socket.socket, token: str | None) -> None:
+    with connection.makefile("rw") as stream:
+        try:
+            handle_coordinator(connection, stream, token)
+        except (ValueError, AttributeError) as error:
+            send_message(
+                stream,
+                Message(type=ERROR_MESSAGE, error=f"Invalid message: {error}"),
+            )
+
+
+def serve_coordinator(
+    server: socket.socket,
+    token: str | None,
+    spec_timeout: float,
+) -> None:
+    """Serve one coordinator, it has `spec_timeout` seconds to send its spec.
+
+    Malformed messages are answered with an error and a dropped or silent
+    coordinator is logged, so neither stops the worker.
+    """
+    connection, address = server.accept()
+    print(f"Coordinator connected from {format_address(address)}", flush=True)
+    connection.settimeout(spec_timeout)
+    with connection:
+        try:
+            handle_connection(connection, token)
+        except OSError as error:
+            print(f"Coordinator {format_address(address)} dropped: {error}", flush=True)
+
+
+def serve(
+    listen_host: str,
+    port: int,
+    once: bool,
+    token: str | None,
+    spec_timeout: float = DEFAULT_SPEC_TIMEOUT,
+) -> None:
+    """Serve coordinators, a token is required unless only loopback can connect.
+
+    A worker measures any target a coordinator names, so it must not take
+    workloads from everyone who can reach its port.
+    """
+    if token is None and not is_loopback(listen_host):
+        raise ValueError(f"A token is required to listen on {listen_host}")
+    with socket.create_server((listen_host, port)) as server:
+        bound_address = format_address(server.getsockname())
+        print(f"{WORKER_READY_PREFIX} {bound_address}", flush=True)
+        while True:
+            serve_coordinator(server, token, spec_timeout)
+            if once:
+                return
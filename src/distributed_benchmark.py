@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+import argparse
+import os
+import secrets
+import time
+
+from cli.arguments import COORDINATOR_DESCRIPTION
+from cli.distributed_arguments import configure_coordinator_arguments
+from distributed.constants import (
+    DEFAULT_WORKER_PORT,
+    TOKEN_ENV_VAR,
+    WORKLOAD_DEFAULT_PORTS,
+)
+from distributed.coordinator import (
+    NodeResult,
+    merge_node_results,
+    run_distributed,
+)
+from distributed.local_workers import spawn_local_workers
+from distributed.protocol import (
+    Address,
+    WorkloadSpec,
+    format_address,
+    parse_address,
+)
+from measurements.measurement_printing import print_measurement_results
+from output.constants import DIVIDE_OP_STR
+
+
+def print_node_progress(node_result: NodeResult) -> None:
+    print(
+        f"  {node_result.node}: {node_result.histogram.count} measurements, "
+        + f"{node_result.failed_attempts} failed",  # noqa: W503
+    )
+
+
+def print_node_results(node_results: list[NodeResult]) -> None:
+    for node_result in node_results:
+        print(f"\nNode: {node_result.node}")
+        if node_result.error:
+            print(f"  Error: {node_result.error}")
+        print_measurement_results(node_result.measurements_stats)
+    print(f"\nAll {len(node_results)} nodes:")
+    print_measurement_results(merge_node_results(node_results))
+
+
+def run_workers(
+    args: argparse.Namespace,
+    workers: list[Address],
+    port: int,
+    token: str,
+) -> list[NodeResult]:
+    with spawn_local_workers(args.local_workers, token) as spawned_workers:
+        spec: WorkloadSpec = {
+            "workload": args.workload,
+            "host": args.host,
+            "port": port,
+            "count": args.count,
+            "timeout": args.timeout,
+            "wait": args.wait,
+            "report_every": args.report_every,
+            "start_at": time.time() + args.start_delay,
+        }
+        return run_distributed(
+            workers + spawned_workers,
+            spec,
+            token,
+            args.timeout,
+            print_node_progress,
+        )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=COORDINATOR_DESCRIPTION)
+    configure_coordinator_arguments(parser)
+    return parser.parse_args()
+
+
+def print_run_settings(
+    args: argparse.Namespace,
+    port: int,
+    workers: list[Address],
+) -> None:
+    worker_count = len(workers) + args.local_workers
+    target = format_address((args.host, port))
+    print(f"Coordinating {args.workload} measurements towards {target}")
+    print(f"  Workers: {worker_count} ({args.local_workers} local)")
+    print(f"  Count: {args.count} per worker")
+    print(f"  Timeout: {args.timeout}s")
+    print(f"  Wait: {args.wait}s")
+    print(f"  Start delay: {args.start_delay}s")
+    print()
+
+
+def run(args: argparse.Namespace) -> None:
+    port = args.port or WORKLOAD_DEFAULT_PORTS[args.workload]
+    workers = [parse_address(worker, DEFAULT_WORKER_PORT) for worker in args.workers]
+    if not workers and not args.local_workers:
+        print("Error: Pass --workers, --local-workers or both")
+        exit(1)
+    print_run_settings(args, port, workers)
+
+    # Local workers only need a token shared with this coordinator.
+    token = args.token or os.environ.get(TOKEN_ENV_VAR) or secrets.token_hex()
+    try:
+        node_results = run_workers(args, workers, port, token)
+    except (OSError, RuntimeError) as error:
+        print(f"Error: Could not reach all workers - {error}")
+        exit(1)
+
+    print_node_results(node_results)
+    failed_count = sum(not node_result.done for node_result in node_results)
+    if failed_count:
+        print(f"\nIncomplete nodes: {failed_count}{DIVIDE_OP_STR}{len(node_results)}")
+        exit(1)
+
+
+def main() -> None:
+    run(parse_arguments())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+import argparse
+import os
+
+from cli.arguments import WORKER_DESCRIPTION
+from cli.distributed_arguments import configure_worker_arguments
+from distributed.constants import TOKEN_ENV_VAR
+from distributed.worker import serve
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=WORKER_DESCRIPTION)
+    configure_worker_arguments(parser)
+    return parser.parse_args()
+
+
+def run(args: argparse.Namespace) -> None:
+    token = args.token or os.environ.get(TOKEN_ENV_VAR)
+    try:
+        serve(args.listen_host, args.port, args.once, token)
+    except ValueError as error:
+        print(f"Error: {error}")
+        exit(1)
+
+
+def main() -> None:
+    run(parse_arguments())
+
+
+if __name__ == "__main__":
+    main()
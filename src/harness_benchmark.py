@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+import argparse
+
+from cli.arguments import HARNESS_DESCRIPTION
+from cli.tool_arguments import configure_harness_arguments
+from output.time_format import format_microseconds
+from selfbench.cases import run_suite
+from selfbench.results import (
+    SelfBenchResult,
+    find_regressions,
+    find_size_mismatches,
+    load_results,
+    save_results,
+)
+
+
+def print_self_bench_results(bench_results: list[SelfBenchResult]) -> None:
+    print("\nResults:")
+    for bench_result in bench_results:
+        print(f"  {bench_result.name}:")
+        print(f"    Operations: {bench_result.operations}")
+        print(f"    Throughput: {bench_result.throughput:.2f} operations/s")
+        per_operation = format_microseconds(bench_result.per_operation)
+        print(f"    Time per operation: {per_operation}")
+        if bench_result.measured:
+            overhead = format_microseconds(bench_result.overhead_per_operation)
+            print(f"    Harness overhead per sample: {overhead}")
+
+
+def print_regressions(
+    regressions: list[tuple[SelfBenchResult, SelfBenchResult]],
+    tolerance: float,
+) -> None:
+    print(f"\nRegressions above {tolerance}%, in overhead per sample where measured:")
+    for bench_result, baseline_result in regressions:
+        current_time = bench_result.compared_per_operation
+        baseline_time = baseline_result.compared_per_operation
+        slowdown = (current_time / baseline_time - 1) * 100 if baseline_time else 0
+        print(
+            f"  {bench_result.name}: {format_microseconds(current_time)} vs "
+            + f"{format_microseconds(baseline_time)} per operation",  # noqa: W503
+            f"(+{slowdown:.2f}%)",
+        )
+
+
+def print_size_mismatches(
+    size_mismatches: list[tuple[SelfBenchResult, SelfBenchResult]],
+) -> None:
+    if not size_mismatches:
+        return
+    print("\nNot compared, the baseline ran a different size:")
+    for bench_result, baseline_result in size_mismatches:
+        print(
+            f"  {bench_result.name}: {bench_result.operations} vs {baseline_result.operations} operations",
+        )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=HARNESS_DESCRIPTION)
+    configure_harness_arguments(parser)
+    return parser.parse_args()
+
+
+def print_run_settings(args: argparse.Namespace) -> None:
+    print("Benchmarking the harness against local stand-in servers")
+    print(f"  Samples: {args.samples}")
+    print(f"  Statements: {args.statements}")
+    print(f"  Count: {args.count}")
+    print(f"  Repeat: {args.repeat}")
+    print(f"  Baseline: {args.baseline}")
+
+
+def run(args: argparse.Namespace) -> None:
+    print_run_settings(args)
+
+    bench_results = run_suite(args.samples, args.statements, args.count, args.repeat)
+    print_self_bench_results(bench_results)
+
+    if args.save:
+        save_results(args.save, bench_results)
+        print(f"\nResults saved to {args.save}")
+
+    if args.baseline:
+        baseline = load_results(args.baseline)
+        print_size_mismatches(find_size_mismatches(bench_results, baseline))
+        regressions = find_regressions(bench_results, baseline, args.tolerance)
+        if regressions:
+            print_regressions(regressions, args.tolerance)
+            exit(1)
+        print(f"\nNo regressions above {args.tolerance}%")
+
+
+def main() -> None:
+    run(parse_arguments())
+
+
+if __name__ == "__main__":
+    main()
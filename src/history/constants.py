@@ -0,0 +1,15 @@
+from types import MappingProxyType
+
+HOUR_BUCKET = "hour"
+DAY_BUCKET = "day"
+WEEK_BUCKET = "week"
+BUCKET_SECONDS = MappingProxyType(
+    {
+        HOUR_BUCKET: 3600,
+        DAY_BUCKET: 86400,
+        WEEK_BUCKET: 604800,
+    },
+)
+SECONDS_PER_DAY = BUCKET_SECONDS[DAY_BUCKET]
+TOOL_MODE_SEPARATOR = ":"
+STATEMENT_HISTORY_MODE = "statement"
@@ -0,0 +1,56 @@
+import argparse
+
+from history.constants import TOOL_MODE_SEPARATOR
+from history.store import (
+    RunHistoryStore,
+    RunParameters,
+    RunRecord,
+    hash_statements,
+)
+from measurements.measurements_stats import MeasurementsStats
+
+COMMAND_ARGUMENT_PREFIX = "command"
+
+
+def get_mode_tool(tool: str, mode: str) -> str:
+    """Tool name of runs in a workload mode, so their trends stay apart."""
+    return f"{tool}{TOOL_MODE_SEPARATOR}{mode}"
+
+
+def collect_run_parameters(
+    args: argparse.Namespace,
+    extra_parameters: RunParameters | None = None,
+) -> RunParameters:
+    """Arguments of the run without the command selection, plus `extra_parameters`."""
+    run_parameters: RunParameters = {
+        argument: argument_value
+        for argument, argument_value in vars(args).items()
+        if not argument.startswith(COMMAND_ARGUMENT_PREFIX)
+    }
+    run_parameters.update(extra_parameters or {})
+    return run_parameters
+
+
+def record_history(  # noqa: WPS211
+    args: argparse.Namespace,
+    tool: str,
+    target: str,
+    started_at: float,
+    measurements_stats: MeasurementsStats,
+    statements: list[str] | None = None,
+    extra_parameters: RunParameters | None = None,
+) -> None:
+    """Store the run in the history database given by --history-db, if any."""
+    if not args.history_db:
+        return
+    run_record = RunRecord(
+        tool=tool,
+        target=target,
+        started_at=started_at,
+        measurements_stats=measurements_stats,
+        statement_hash=hash_statements(statements) if statements else None,
+        run_parameters=collect_run_parameters(args, extra_parameters),
+    )
+    with RunHistoryStore(args.history_db) as history_store:
+        run_id = history_store.record_run(run_record, args.store_samples)
+    print(f"\nStored run {run_id} in {args.history_db}")
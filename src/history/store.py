@@ -0,0 +1,169 @@
+import hashlib
+import json
+import sqlite3
+from dataclasses import dataclass, field
+
+from measurements.latency_histogram import LatencyHistogram
+from measurements.measurements_stats import MeasurementsStats
+
+STATEMENT_HASH_LENGTH = 16
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    tool TEXT NOT NULL,
+    target TEXT NOT NULL,
+    statement_hash TEXT,
+    parameters TEXT NOT NULL,
+    attempts INTEGER NOT NULL,
+    failed_attempts INTEGER NOT NULL,
+    min REAL NOT NULL,
+    max REAL NOT NULL,
+    mean REAL NOT NULL,
+    median REAL NOT NULL,
+    stdev REAL NOT NULL,
+    histogram TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_target_tool_time ON runs (target, tool, started_at);
+CREATE INDEX IF NOT EXISTS runs_tool_time ON runs (tool, started_at);
+CREATE INDEX IF NOT EXISTS runs_statement_time ON runs (statement_hash, started_at);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs (run_id),
+    sample_index INTEGER NOT NULL,
+    latency REAL NOT NULL,
+    PRIMARY KEY (run_id, sample_index)
+) WITHOUT ROWID;
+"""
+
+INSERT_RUN = """
+INSERT INTO runs (
+    started_at, tool, target, statement_hash, parameters, attempts, failed_attempts,
+    min, max, mean, median, stdev, histogram
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+INSERT_SAMPLE = "INSERT INTO samples (run_id, sample_index, latency) VALUES (?, ?, ?)"
+
+SELECT_RUN_SUMMARIES = """
+SELECT started_at, attempts, failed_attempts, histogram FROM runs
+WHERE target = ? AND started_at >= ?
+"""
+TOOL_FILTER = " AND tool = ?"
+STATEMENT_FILTER = " AND statement_hash = ?"
+ORDER_BY_TIME = " ORDER BY started_at"
+
+ParameterValue = str | int | float | bool | list[str] | None  # noqa: WPS221, WPS465
+RunParameters = dict[str, ParameterValue]
+
+
+def hash_statements(statements: list[str]) -> str:
+    normalized = ";\n".join(" ".join(statement.split()) for statement in statements)
+    return hashlib.sha256(normalized.encode()).hexdigest()[:STATEMENT_HASH_LENGTH]
+
+
+@dataclass
+class RunRecord:
+    """One run of a tool, `started_at` is a Unix timestamp in seconds."""
+
+    tool: str
+    target: str
+    started_at: float
+    measurements_stats: MeasurementsStats
+    statement_hash: str | None = None
+    run_parameters: RunParameters = field(default_factory=dict)
+
+
+@dataclass
+class RunSummary:
+    started_at: float
+    attempts: int
+    failed_attempts: int
+    histogram: LatencyHistogram
+
+
+class RunHistoryStore:
+    """Embedded SQLite store of past runs with their mergeable latency summaries."""
+
+    def __init__(self, database_path: str) -> None:
+        self.database_path = database_path
+        self._connection = sqlite3.connect(database_path)
+        with self._connection:
+            self._connection.executescript(SCHEMA)
+
+    def __enter__(self) -> "RunHistoryStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def record_run(self, run_record: RunRecord, store_samples: bool = False) -> int:
+        """Store a run and optionally its raw samples in one transaction."""
+        stats = run_record.measurements_stats
+        histogram = LatencyHistogram.from_latencies(stats.latencies)
+        with self._connection:
+            cursor = self._connection.execute(
+                INSERT_RUN,
+                (
+                    run_record.started_at,
+                    run_record.tool,
+                    run_record.target,
+                    run_record.statement_hash,
+                    json.dumps(run_record.run_parameters, default=str),
+                    stats.attempts,
+                    stats.failed_attempts,
+                    stats.min,
+                    stats.max,
+                    stats.mean,
+                    stats.median,
+                    stats.stdev,
+                    json.dumps(histogram.to_dict()),
+                ),
+            )
+            run_id = int(cursor.lastrowid or 0)
+            if store_samples:
+                self._insert_samples(run_id, stats.latencies)
+        return run_id
+
+    def query_run_summaries(
+        self,
+        target: str,
+        since: float,
+        tool: str | None = None,
+        statement_hash: str | None = None,
+    ) -> list[RunSummary]:
+        query = SELECT_RUN_SUMMARIES
+        query_parameters: list[str | float] = [target, since]
+        if tool:
+            query += TOOL_FILTER
+            query_parameters.append(tool)
+        if statement_hash:
+            query += STATEMENT_FILTER
+            query_parameters.append(statement_hash)
+        rows = self._connection.execute(query + ORDER_BY_TIME, query_parameters)
+        return [_read_run_summary(*row) for row in rows]
+
+    def _insert_samples(self, run_id: int, latencies: list[float]) -> None:
+        self._connection.executemany(
+            INSERT_SAMPLE,
+            (
+                (run_id, sample_index, latency)
+                for sample_index, latency in enumerate(latencies)
+            ),
+        )
+
+
+def _read_run_summary(
+    started_at: float,
+    attempts: int,
+    failed_attempts: int,
+    histogram: str,
+) -> RunSummary:
+    return RunSummary(
+        started_at=started_at,
+        attempts=attempts,
+        failed_attempts=failed_attempts,
+        histogram=LatencyHistogram.from_dict(json.loads(histogram)),
+    )
@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+
+from history.store import RunSummary
+from measurements.latency_histogram import LatencyHistogram
+
+
+@dataclass
+class TrendPoint:
+    """Merged runs of one time bucket, `bucket_start` is a Unix timestamp (UTC)."""
+
+    bucket_start: float
+    runs: int = 0
+    attempts: int = 0
+    failed_attempts: int = 0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+def summarize_trend(
+    run_summaries: list[RunSummary],
+    bucket_seconds: int,
+) -> list[TrendPoint]:
+    trend_points: dict[float, TrendPoint] = {}
+    for run_summary in run_summaries:
+        bucket_start = run_summary.started_at - run_summary.started_at % bucket_seconds
+        trend_point = trend_points.setdefault(bucket_start, TrendPoint(bucket_start))
+        trend_point.runs += 1
+        trend_point.attempts += run_summary.attempts
+        trend_point.failed_attempts += run_summary.failed_attempts
+        trend_point.histogram.merge(run_summary.histogram)
+    return sorted(trend_points.values(), key=lambda point: point.bucket_start)
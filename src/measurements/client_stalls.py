@@ -0,0 +1,140 @@
+import gc
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator
+
+from measurements.constants import (
+    DEFAULT_JITTER_INTERVAL,
+    DEFAULT_STALL_THRESHOLD,
+    get_switch_interval,
+)
+
+
+@dataclass
+class SampleStall:
+    """Client side view of a single timed sample, all times in milliseconds."""
+
+    wall_time: float = 0
+    cpu_time: float = 0
+    gc_collections: int = 0
+    gc_pause: float = 0
+    hiccups: float = 0
+    stalled: bool = False
+
+
+class ClientStallMonitor:  # noqa: WPS230
+    """Flags samples that coincide with GC pauses or scheduling hiccups of the client.
+
+    A background jitter-meter thread sleeps for `jitter_interval` milliseconds in a
+    loop and adds every oversleep above `stall_threshold` to a running total. GC
+    collections are totalled through `gc.callbacks`. A sample reads both totals
+    when it starts and ends, and is flagged as stalled if either grew by at least
+    `stall_threshold` milliseconds in between.
+
+    The jitter meter has to win the GIL back after every sleep, so a sample that
+    runs Python code delays it by up to one switch interval without any real
+    stall. `stall_threshold` must therefore be above `sys.getswitchinterval()`.
+
+    The totals only have a single writer each and are never locked: a GC callback
+    may run on any thread at any allocation, including while a sample is evaluated.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        jitter_interval: float = DEFAULT_JITTER_INTERVAL,
+        stall_threshold: float = DEFAULT_STALL_THRESHOLD,
+        exclude_stalls: bool = False,
+    ) -> None:
+        if enabled and stall_threshold <= get_switch_interval():
+            raise ValueError(
+                f"The stall threshold of {stall_threshold}ms must be above the "
+                + f"GIL switch interval of {get_switch_interval()}ms",  # noqa: W503
+            )
+        self.enabled = enabled
+        self.jitter_interval = jitter_interval
+        self.stall_threshold = stall_threshold
+        self.exclude_stalls = exclude_stalls
+        self.samples: list[SampleStall] = []
+        self.max_hiccup: float = 0
+        self.hiccups: float = 0
+        self.gc_collections = 0
+        self.gc_pause: float = 0
+        self._gc_start: float = 0
+        self._stop_event = threading.Event()
+        self._jitter_thread: threading.Thread | None = None
+
+    def __enter__(self) -> "ClientStallMonitor":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if not self.enabled or self._jitter_thread:
+            return
+        self._stop_event.clear()
+        gc.callbacks.append(self._on_gc)
+        self._jitter_thread = threading.Thread(
+            target=self._measure_jitter,
+            name="jitter-meter",
+            daemon=True,
+        )
+        self._jitter_thread.start()
+
+    def stop(self) -> None:
+        if not self._jitter_thread:
+            return
+        self._stop_event.set()
+        self._jitter_thread.join()
+        self._jitter_thread = None
+        gc.callbacks.remove(self._on_gc)
+
+    @contextmanager
+    def sample(self) -> Iterator[SampleStall]:
+        start = SampleStall(
+            wall_time=time.perf_counter() * 1000,
+            cpu_time=time.process_time() * 1000,
+            gc_collections=self.gc_collections,
+            gc_pause=self.gc_pause,
+            hiccups=self.hiccups,
+        )
+        stall = SampleStall()
+        try:
+            yield stall
+        finally:
+            stall.wall_time = time.perf_counter() * 1000 - start.wall_time
+            stall.cpu_time = time.process_time() * 1000 - start.cpu_time
+            if self.enabled:
+                stall.gc_collections = self.gc_collections - start.gc_collections
+                stall.gc_pause = self.gc_pause - start.gc_pause
+                stall.hiccups = self.hiccups - start.hiccups
+                stall.stalled = (
+                    stall.gc_pause >= self.stall_threshold
+                    or stall.hiccups >= self.stall_threshold  # noqa: W503
+                )
+                self.samples.append(stall)
+
+    def excludes(self, stall: SampleStall) -> bool:
+        return self.exclude_stalls and stall.stalled
+
+    def _on_gc(self, phase: str, gc_info: dict[str, int]) -> None:
+        if phase == "start":
+            self._gc_start = time.perf_counter()
+            return
+        self.gc_pause += (time.perf_counter() - self._gc_start) * 1000
+        self.gc_collections += 1
+
+    def _measure_jitter(self) -> None:
+        interval = self.jitter_interval / 1000
+        while True:
+            before = time.perf_counter()
+            if self._stop_event.wait(interval):
+                return
+            hiccup = (time.perf_counter() - before - interval) * 1000
+            self.max_hiccup = max(self.max_hiccup, hiccup)
+            if hiccup >= self.stall_threshold:
+                self.hiccups += hiccup
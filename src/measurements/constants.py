@@ -0,0 +1,9 @@
+import sys
+
+DEFAULT_JITTER_INTERVAL = 10.0
+DEFAULT_STALL_THRESHOLD = 20.0
+
+
+def get_switch_interval() -> float:
+    """The interpreter's GIL switch interval in milliseconds."""
+    return sys.getswitchinterval() * 1000
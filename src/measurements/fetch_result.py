@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+from measurements.measurements_stats import MeasurementsStats
+
+
+@dataclass
+class FetchResult:
+    """Timings and memory of one fetch strategy, sizes in bytes."""
+
+    strategy: str
+    measurements_stats: MeasurementsStats
+    rows: int
+    fetched_bytes: int
+    traced_peak: int
+    rss_peak: int | None
+
+    @property
+    def rows_per_second(self) -> float:
+        if not self.measurements_stats.mean:
+            return 0
+        return self.rows / self.measurements_stats.mean * 1000
+
+    @property
+    def bytes_per_second(self) -> float:
+        if not self.measurements_stats.mean:
+            return 0
+        return self.fetched_bytes / self.measurements_stats.mean * 1000
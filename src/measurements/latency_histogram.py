@@ -0,0 +1,130 @@
+import math
+from typing import TypedDict
+
+DEFAULT_PRECISION = 0.01
+MIN_TRACKED_LATENCY = 0.001
+MEDIAN_PERCENTILE = 50
+
+
+class HistogramDict(TypedDict):
+    precision: float
+    buckets: dict[str, int]
+    count: int
+    total: float
+    total_squares: float
+    min: float
+    max: float
+
+
+class LatencyHistogram:  # noqa: WPS214, WPS230
+    """Mergeable latency summary with log-scaled buckets.
+
+    A latency lands in bucket `floor(log(latency) / log(1 + precision))`, so every
+    percentile is within `precision` of the exact value. Count, sum, sum of squares,
+    min and max are tracked exactly. Two histograms with the same precision merge
+    by adding their buckets, which makes them suitable for storing and combining
+    results of separate runs or hosts without the raw samples.
+    """
+
+    def __init__(self, precision: float = DEFAULT_PRECISION) -> None:
+        self.precision = precision
+        self.buckets: dict[int, int] = {}
+        self.count = 0
+        self.total: float = 0
+        self.total_squares: float = 0
+        self.min: float = 0
+        self.max: float = 0
+        self._log_base = math.log1p(precision)
+
+    @classmethod
+    def from_latencies(
+        cls,
+        latencies: list[float],
+        precision: float = DEFAULT_PRECISION,
+    ) -> "LatencyHistogram":
+        histogram = cls(precision)
+        for latency in latencies:
+            histogram.record(latency)
+        return histogram
+
+    @classmethod
+    def from_dict(cls, histogram_dict: HistogramDict) -> "LatencyHistogram":
+        histogram = cls(histogram_dict["precision"])
+        histogram.buckets = {
+            int(bucket_index): count
+            for bucket_index, count in histogram_dict["buckets"].items()
+        }
+        histogram.count = histogram_dict["count"]
+        histogram.total = histogram_dict["total"]
+        histogram.total_squares = histogram_dict["total_squares"]
+        histogram.min = histogram_dict["min"]
+        histogram.max = histogram_dict["max"]
+        return histogram
+
+    def to_dict(self) -> HistogramDict:
+        return {
+            "precision": self.precision,
+            "buckets": {str(index): count for index, count in self.buckets.items()},
+            "count": self.count,
+            "total": self.total,
+            "total_squares": self.total_squares,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    def record(self, latency: float) -> None:
+        bucket_index = self._bucket_index(latency)
+        self.buckets[bucket_index] = self.buckets.get(bucket_index, 0) + 1
+        self.min = min(self.min, latency) if self.count else latency
+        self.max = max(self.max, latency) if self.count else latency
+        self.count += 1
+        self.total += latency
+        self.total_squares += latency * latency
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if other.precision != self.precision:
+            raise ValueError(
+                f"Cannot merge histograms with precision {other.precision} "
+                + f"into {self.precision}",  # noqa: W503
+            )
+        if not other.count:
+            return
+        for bucket_index, count in other.buckets.items():
+            self.buckets[bucket_index] = self.buckets.get(bucket_index, 0) + count
+        self.min = min(self.min, other.min) if self.count else other.min
+        self.max = max(self.max, other.max) if self.count else other.max
+        self.count += other.count
+        self.total += other.total
+        self.total_squares += other.total_squares
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation, like `statistics.stdev`."""
+        if self.count < 2:
+            return 0
+        squared_deviations = self.total_squares - self.count * self.mean**2
+        variance = squared_deviations / (self.count - 1)
+        return math.sqrt(max(variance, 0))
+
+    def percentile(self, percent: float) -> float:
+        if not self.count:
+            return 0
+        rank = max(math.ceil(percent / 100 * self.count), 1)
+        seen = 0
+        for bucket_index in sorted(self.buckets):
+            seen += self.buckets[bucket_index]
+            if seen >= rank:
+                return self._bucket_value(bucket_index)
+        return self.max
+
+    def _bucket_index(self, latency: float) -> int:
+        return math.floor(math.log(max(latency, MIN_TRACKED_LATENCY)) / self._log_base)
+
+    def _bucket_value(self, bucket_index: int) -> float:
+        # Geometric middle of the bucket, kept inside the exactly known range.
+        bucket_value = math.exp((bucket_index + 0.5) * self._log_base)
+        return min(max(bucket_value, self.min), self.max)
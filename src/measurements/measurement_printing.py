@@ -1,4 +1,10 @@
+from measurements.client_stalls import ClientStallMonitor
+from measurements.fetch_result import FetchResult
 from measurements.measurements_stats import MeasurementsStats
+from measurements.workload_result import WorkloadResult
+from output.constants import DIVIDE_OP_STR
+from output.number_format import format_decimal
+from output.size_format import format_bytes
 from output.time_format import format_seconds
 
 
@@ -22,3 +28,74 @@ def print_measurement_results(measurements_stats: MeasurementsStats) -> None:
     print(
         f"  Success rate: {measurements_stats.attempts}/{measurements_stats.attempts + measurements_stats.failed_attempts}",  # noqa: E501
     )
+    if measurements_stats.stalled_latencies:
+        print(
+            f"  Excluded client stalls: {len(measurements_stats.stalled_latencies)}",
+        )
+
+
+def print_client_stall_results(stall_monitor: ClientStallMonitor) -> None:
+    if not stall_monitor.enabled:
+        return
+    stalled_samples = [stall for stall in stall_monitor.samples if stall.stalled]
+    wall_time = sum(stall.wall_time for stall in stall_monitor.samples)
+    cpu_time = sum(stall.cpu_time for stall in stall_monitor.samples)
+    print("\nClient stalls:")
+    print(
+        f"  Flagged samples: {len(stalled_samples)}{DIVIDE_OP_STR}{len(stall_monitor.samples)}",
+    )
+    print(
+        f"  GC collections: {stall_monitor.gc_collections} ({format_seconds(stall_monitor.gc_pause)} paused)",
+    )
+    print(
+        f"  Maximum scheduling hiccup: {format_seconds(stall_monitor.max_hiccup)}",
+    )
+    if wall_time:
+        print(
+            f"  Client CPU time: {format_seconds(cpu_time)} of {format_seconds(wall_time)} wall time",
+        )
+    for sample_index, stall in enumerate(stall_monitor.samples, start=1):
+        if stall.stalled:
+            print(
+                f"  # {sample_index}: {format_seconds(stall.wall_time)} wall, "
+                + f"{stall.gc_collections} GC ({format_seconds(stall.gc_pause)}), "  # noqa: W503
+                + f"hiccups {format_seconds(stall.hiccups)}",  # noqa: W503
+            )
+
+
+def print_workload_results(workload_result: WorkloadResult) -> None:
+    print_measurement_results(workload_result.measurements_stats)
+    print(f"  Throughput: {format_decimal(workload_result.throughput)} executions/s")
+    round_trips = workload_result.round_trips_per_execution
+    if round_trips is not None:
+        print(f"  Round trips per execution: {format_decimal(round_trips)}")
+
+
+def print_workload_comparison(workload_results: list[WorkloadResult]) -> None:
+    baseline = workload_results[0]
+    print(f"\nComparison against {baseline.mode}:")
+    for workload_result in workload_results[1:]:
+        median_delta = workload_result.median_delta(baseline)
+        comparison = (
+            f"  {workload_result.mode}: median latency {median_delta:+.2f}ms, "
+            + f"throughput x{format_decimal(workload_result.throughput_ratio(baseline))}"  # noqa: W503
+        )
+        saved = workload_result.round_trips_saved(baseline)
+        if saved is not None:
+            comparison = f"{comparison}, round trips saved per execution: {format_decimal(saved)}"
+        print(comparison)
+
+
+def print_fetch_results(fetch_results: list[FetchResult]) -> None:
+    for fetch_result in fetch_results:
+        print(f"\nStrategy: {fetch_result.strategy}")
+        print_measurement_results(fetch_result.measurements_stats)
+        rows_per_second = f"{format_decimal(fetch_result.rows_per_second)} rows/s"
+        print(f"  Rows: {fetch_result.rows} ({rows_per_second})")
+        print(
+            f"  Payload: {format_bytes(fetch_result.fetched_bytes)} "
+            + f"({format_bytes(fetch_result.bytes_per_second)}/s)",  # noqa: W503
+        )
+        print(f"  Peak traced memory: {format_bytes(fetch_result.traced_peak)}")
+        if fetch_result.rss_peak is not None:
+            print(f"  Peak RSS: {format_bytes(fetch_result.rss_peak)}")
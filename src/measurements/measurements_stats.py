@@ -1,9 +1,17 @@
 import statistics
 
+from measurements.latency_histogram import MEDIAN_PERCENTILE, LatencyHistogram
+
 
 class MeasurementsStats:  # noqa: WPS230
-    def __init__(self, measurements: list[float], failed_attempts: int = 0) -> None:
+    def __init__(
+        self,
+        measurements: list[float],
+        failed_attempts: int = 0,
+        stalled_measurements: list[float] | None = None,
+    ) -> None:
         self.latencies = measurements
+        self.stalled_latencies = stalled_measurements or []
         self.min: float = 0
         self.max: float = 0
         self.mean: float = 0
@@ -18,4 +26,22 @@ class MeasurementsStats:  # noqa: WPS230
             self.stdev = statistics.stdev(self.latencies)
 
         self.failed_attempts = failed_attempts
-        self.attempts = len(self.latencies) + failed_attempts
+        self.attempts = (
+            len(self.latencies) + len(self.stalled_latencies) + failed_attempts
+        )
+
+    @classmethod
+    def from_histogram(
+        cls,
+        histogram: LatencyHistogram,
+        failed_attempts: int = 0,
+    ) -> "MeasurementsStats":
+        """Statistics of a merged summary, without the raw samples in `latencies`."""
+        measurements_stats = cls([], failed_attempts)
+        measurements_stats.min = histogram.min
+        measurements_stats.max = histogram.max
+        measurements_stats.mean = histogram.mean
+        measurements_stats.median = histogram.percentile(MEDIAN_PERCENTILE)
+        measurements_stats.stdev = histogram.stdev
+        measurements_stats.attempts = histogram.count + failed_attempts
+        return measurements_stats
@@ -0,0 +1,59 @@
+import sys
+import tracemalloc
+from typing import Callable, TypeVar
+
+if sys.platform != "win32":
+    import resource  # noqa: WPS433
+
+TracedResult = TypeVar("TracedResult")
+
+PROC_STATUS_PATH = "/proc/self/status"
+PROC_CLEAR_REFS_PATH = "/proc/self/clear_refs"
+PEAK_RSS_FIELD = "VmHWM:"
+RESET_PEAK_RSS = "5"
+KIBIBYTE = 1024
+
+
+def reset_peak_rss() -> None:
+    """Reset the RSS high-water mark, only supported on Linux."""
+    try:
+        with open(PROC_CLEAR_REFS_PATH, "w") as clear_refs:
+            clear_refs.write(RESET_PEAK_RSS)
+    except OSError:
+        return
+
+
+def read_proc_peak_rss() -> int | None:
+    try:
+        with open(PROC_STATUS_PATH, "r") as status:
+            for line in status:
+                if line.startswith(PEAK_RSS_FIELD):
+                    return int(line.split()[1]) * KIBIBYTE
+    except OSError:
+        return None
+    return None
+
+
+def read_peak_rss() -> int | None:
+    """Peak resident set size in bytes since the last reset, None if unknown."""
+    proc_peak_rss = read_proc_peak_rss()
+    if proc_peak_rss is not None:
+        return proc_peak_rss
+    if sys.platform == "win32":
+        return None
+    # ru_maxrss is the lifetime peak, reported in bytes on macOS and KiB elsewhere.
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * KIBIBYTE
+
+
+def trace_peak_allocations(
+    function: Callable[[], TracedResult],
+) -> tuple[TracedResult, int]:
+    """Run `function` with tracemalloc enabled, return its result and the peak traced bytes."""
+    tracemalloc.start()
+    try:  # noqa: WPS501
+        traced_result = function()
+    finally:
+        _, traced_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return traced_result, traced_peak
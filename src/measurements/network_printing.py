@@ -0,0 +1,40 @@
+import statistics
+
+from measurements.network_probe import LatencySplit, NetworkProbe
+from output.constants import DIVIDE_OP_STR
+from output.time_format import format_seconds
+
+
+def format_latency_split(latency_split: LatencySplit) -> str:
+    unit = "round trip" if latency_split.round_trips == 1 else "round trips"
+    round_trips = f"{latency_split.round_trips:g} {unit}"
+    network_share = f"{round_trips}, {latency_split.network_share:.1%}"
+    return (
+        f"{format_seconds(latency_split.latency)} = "
+        + f"{format_seconds(latency_split.network)} network ({network_share}) + "  # noqa: W503
+        + f"{format_seconds(latency_split.remainder)} other"  # noqa: W503
+    )
+
+
+def print_network_split(network_probe: NetworkProbe) -> None:
+    if not network_probe.enabled:
+        return
+    probe_stats = network_probe.probe_stats
+    print("\nNetwork probe:")
+    print(
+        f"  Probes: {len(probe_stats.latencies)}{DIVIDE_OP_STR}{probe_stats.attempts}, "
+        + f"median round trip {format_seconds(probe_stats.median)}",  # noqa: W503
+    )
+    latency_splits = network_probe.latency_splits()
+    if not latency_splits:
+        return
+    if not network_probe.count_round_trips:
+        print("  One round trip per sample, count them with --count-round-trips")
+    for sample_index, latency_split in enumerate(latency_splits, start=1):
+        print(f"  # {sample_index}: {format_latency_split(latency_split)}")
+    mean_split = LatencySplit(
+        latency=statistics.mean(split.latency for split in latency_splits),
+        network=statistics.mean(split.network for split in latency_splits),
+        round_trips=statistics.mean(split.round_trips for split in latency_splits),
+    )
+    print(f"  Mean: {format_latency_split(mean_split)}")
@@ -0,0 +1,176 @@
+import bisect
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Iterator
+
+from connection.constants import DEFAULT_PROBE_INTERVAL
+from measurements.measurements_stats import MeasurementsStats
+
+
+@dataclass
+class ProbedSample:
+    """Timeline window of a sample on the `time.perf_counter` clock in seconds.
+
+    The caller sets `latency` once the sample succeeded, samples without it are
+    left out of the split. `round_trips` stays at one unless the caller counted
+    the round trips of the sample.
+    """
+
+    started: float = 0
+    finished: float = 0
+    latency: float | None = None
+    round_trips: float = 1
+
+
+@dataclass
+class LatencySplit:
+    """A sample latency split into its network round trips and the rest, in ms."""
+
+    latency: float
+    network: float
+    round_trips: float = 1
+
+    @property
+    def remainder(self) -> float:
+        return self.latency - self.network
+
+    @property
+    def network_share(self) -> float:
+        return self.network / self.latency if self.latency else 0
+
+
+def _nearest_probe_latency(
+    probe_times: list[float],
+    probe_latencies: list[float],
+    middle: float,
+    index: int,
+) -> float | None:
+    """Latency of the probe closest to `middle` out of the two around `index`."""
+    nearest = [
+        (abs(probe_times[candidate] - middle), probe_latencies[candidate])
+        for candidate in (index - 1, index)
+        if 0 <= candidate < len(probe_times)
+    ]
+    return min(nearest)[1] if nearest else None
+
+
+class NetworkProbe:  # noqa: WPS230
+    """Runs a network probe in the background while samples are taken.
+
+    A probe thread calls `probe` every `interval` milliseconds and keeps each
+    probe latency together with the middle of its probe window. Every sample
+    taken through `sample()` records its own window on the same clock, so the
+    probes that ran while the sample ran give the network round trip time of that
+    sample. A sample without a probe inside its window uses the nearest probe.
+    Its network time is that round trip time once per round trip of the sample,
+    the samplers only count them if `count_round_trips` is set.
+    """
+
+    def __init__(
+        self,
+        probe: Callable[[], float],
+        interval: float = DEFAULT_PROBE_INTERVAL,
+        enabled: bool = True,
+        count_round_trips: bool = False,
+    ) -> None:
+        self.probe = probe
+        self.interval = interval
+        self.enabled = enabled
+        self.count_round_trips = count_round_trips
+        self.samples: list[ProbedSample] = []
+        self.probe_times: list[float] = []
+        self.probe_latencies: list[float] = []
+        self.failed_probes = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._probe_thread: threading.Thread | None = None
+
+    def __enter__(self) -> "NetworkProbe":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        if not self.enabled or self._probe_thread:
+            return
+        self._stop_event.clear()
+        self._probe_thread = threading.Thread(
+            target=self._run_probes,
+            name="network-probe",
+            daemon=True,
+        )
+        self._probe_thread.start()
+
+    def stop(self) -> None:
+        if not self._probe_thread:
+            return
+        self._stop_event.set()
+        self._probe_thread.join()
+        self._probe_thread = None
+
+    @contextmanager
+    def sample(self) -> Iterator[ProbedSample]:
+        probed_sample = ProbedSample(started=time.perf_counter())
+        yield probed_sample
+        probed_sample.finished = time.perf_counter()
+        if self.enabled:
+            self.samples.append(probed_sample)
+
+    @property
+    def probe_stats(self) -> MeasurementsStats:
+        return MeasurementsStats(list(self.probe_latencies), self.failed_probes)
+
+    def round_trip_time(self, started: float, finished: float) -> float | None:
+        with self._lock:
+            first = bisect.bisect_left(self.probe_times, started)
+            last = bisect.bisect_right(self.probe_times, finished)
+            if first < last:
+                return statistics.median(self.probe_latencies[first:last])
+            return _nearest_probe_latency(
+                self.probe_times,
+                self.probe_latencies,
+                (started + finished) / 2,
+                first,
+            )
+
+    def latency_splits(self) -> list[LatencySplit]:
+        """Split every successful sample, the network share is capped at its latency."""
+        latency_splits = []
+        for probed_sample in self.samples:
+            if probed_sample.latency is None:
+                continue
+            round_trip_time = self.round_trip_time(
+                probed_sample.started,
+                probed_sample.finished,
+            )
+            if round_trip_time is None:
+                continue
+            network = round_trip_time * probed_sample.round_trips
+            latency_splits.append(
+                LatencySplit(
+                    latency=probed_sample.latency,
+                    network=min(network, probed_sample.latency),
+                    round_trips=probed_sample.round_trips,
+                ),
+            )
+        return latency_splits
+
+    def _run_probes(self) -> None:
+        interval = self.interval / 1000
+        while True:
+            started = time.perf_counter()
+            try:
+                latency = self.probe()
+            except Exception:
+                self.failed_probes += 1
+            else:
+                with self._lock:
+                    self.probe_times.append(started + latency / 2 / 1000)
+                    self.probe_latencies.append(latency)
+            if self._stop_event.wait(interval):
+                return
@@ -0,0 +1,147 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, ContextManager
+
+from measurements.latency_histogram import MEDIAN_PERCENTILE, LatencyHistogram
+
+KNEE_PERCENTILE = 99
+
+Sampler = Callable[[], float]
+SamplerFactory = Callable[[], ContextManager[Sampler]]
+
+
+@dataclass
+class RampStep:
+    """Load of one ramp step, `duration` is the measured hold time in ms."""
+
+    concurrency: int
+    duration: float = 0
+    failed_attempts: int = 0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def attempts(self) -> int:
+        return self.histogram.count + self.failed_attempts
+
+    @property
+    def error_rate(self) -> float:
+        return self.failed_attempts / self.attempts if self.attempts else 0
+
+    @property
+    def throughput(self) -> float:
+        return self.histogram.count / self.duration * 1000 if self.duration else 0
+
+    @property
+    def median(self) -> float:
+        return self.histogram.percentile(MEDIAN_PERCENTILE)
+
+    @property
+    def p99(self) -> float:
+        return self.histogram.percentile(KNEE_PERCENTILE)
+
+
+@dataclass
+class RampResult:
+    """`knee` is the last step within the limits, `breach` the step crossing them."""
+
+    steps: list[RampStep]
+    knee: RampStep | None
+    breach: RampStep | None
+
+
+class _StepRunner:
+    def __init__(
+        self,
+        sampler_factory: SamplerFactory,
+        concurrency: int,
+        hold: float,
+        settle: float,
+    ) -> None:
+        self.sampler_factory = sampler_factory
+        self.ramp_step = RampStep(concurrency)
+        self.hold = hold
+        self.settle = settle
+        self.record_from: float = 0
+        self.stop_at: float = 0
+        self._lock = threading.Lock()
+        # Every worker sets up its sampler (e.g. a connection) before the step
+        # timer starts, so setup time is not part of the hold time.
+        self._barrier = threading.Barrier(concurrency, action=self._start_timer)
+
+    def run(self) -> RampStep:
+        concurrency = self.ramp_step.concurrency
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(concurrency):
+                executor.submit(self._work)
+        return self.ramp_step
+
+    def _start_timer(self) -> None:
+        self.record_from = time.perf_counter() + self.settle
+        self.stop_at = self.record_from + self.hold
+        self.ramp_step.duration = self.hold * 1000
+
+    def _work(self) -> None:
+        try:
+            with self.sampler_factory() as sample:
+                self._barrier.wait()
+                self._sample_until_stop(sample)
+        except threading.BrokenBarrierError:
+            return
+        except Exception:
+            # A worker that cannot set up its sampler fails the whole step.
+            with self._lock:
+                self.ramp_step.failed_attempts += 1
+            self._barrier.abort()
+
+    def _sample_until_stop(self, sample: Sampler) -> None:
+        while time.perf_counter() < self.stop_at:
+            latency = _try_sample(sample)
+            finished = time.perf_counter()
+            if self.record_from <= finished <= self.stop_at:
+                self._record(latency)
+
+    def _record(self, latency: float | None) -> None:
+        with self._lock:
+            if latency is None:
+                self.ramp_step.failed_attempts += 1
+            else:
+                self.ramp_step.histogram.record(latency)
+
+
+def _try_sample(sample: Sampler) -> float | None:
+    try:
+        return sample()
+    except Exception:
+        return None
+
+
+def run_ramp(  # noqa: WPS211
+    sampler_factory: SamplerFactory,
+    start: int,
+    step: int,
+    maximum: int,
+    hold: float,
+    settle: float,
+    p99_limit: float | None,
+    error_limit: float,
+    on_step: Callable[[RampStep], None],
+) -> RampResult:
+    """Raise the concurrency step by step until p99 or the error rate cross a limit."""
+    if start < 1 or step < 1 or start > maximum:
+        raise ValueError(
+            f"Invalid ramp from {start} to {maximum} by {step}, "
+            + "all need to be at least 1 and start at most the maximum",  # noqa: W503
+        )
+    steps: list[RampStep] = []
+    knee = None
+    for concurrency in range(start, maximum + 1, step):
+        ramp_step = _StepRunner(sampler_factory, concurrency, hold, settle).run()
+        on_step(ramp_step)
+        steps.append(ramp_step)
+        p99_crossed = p99_limit is not None and ramp_step.p99 > p99_limit
+        if p99_crossed or ramp_step.error_rate > error_limit:
+            return RampResult(steps, knee, ramp_step)
+        knee = ramp_step
+    return RampResult(steps, knee, None)
@@ -0,0 +1,31 @@
+import argparse
+
+from cli.ramp_options import check_ramp_arguments
+from measurements.ramp import SamplerFactory, run_ramp
+from measurements.ramp_printing import print_ramp_results, print_ramp_step
+
+
+def run_ramp_mode(
+    args: argparse.Namespace,
+    sampler_factory: SamplerFactory,
+    load_name: str,
+) -> None:
+    """Ramp the load set by the --ramp-* options, printing each step as it ends."""
+    check_ramp_arguments(args)
+    print(
+        f"  Ramp: {load_name} {args.ramp_start} to {args.ramp_max} "
+        + f"by {args.ramp_step}, {args.ramp_hold}s per step",  # noqa: W503
+    )
+    print("\nThroughput vs latency:")
+    ramp_result = run_ramp(
+        sampler_factory=sampler_factory,
+        start=args.ramp_start,
+        step=args.ramp_step,
+        maximum=args.ramp_max,
+        hold=args.ramp_hold,
+        settle=args.ramp_settle,
+        p99_limit=args.max_p99,
+        error_limit=args.max_error_rate,
+        on_step=print_ramp_step,
+    )
+    print_ramp_results(ramp_result)
@@ -0,0 +1,30 @@
+from measurements.ramp import RampResult, RampStep
+from output.time_format import format_seconds
+
+
+def print_ramp_step(ramp_step: RampStep) -> None:
+    step_values = (
+        f"{ramp_step.throughput:.2f} executions/s",
+        f"median {format_seconds(ramp_step.median)}",
+        f"p99 {format_seconds(ramp_step.p99)}",
+        f"max {format_seconds(ramp_step.histogram.max)}",
+        f"errors {ramp_step.error_rate:.2%}",
+    )
+    print(f"  Concurrency {ramp_step.concurrency}: {', '.join(step_values)}")
+
+
+def print_ramp_results(ramp_result: RampResult) -> None:
+    if ramp_result.breach is None:
+        print("\nNo limit crossed, the knee lies above the highest concurrency")
+        return
+    print(
+        f"\nLimit crossed at concurrency {ramp_result.breach.concurrency} "
+        + f"(p99 {format_seconds(ramp_result.breach.p99)}, "  # noqa: W503
+        + f"errors {ramp_result.breach.error_rate:.2%})",  # noqa: W503
+    )
+    if ramp_result.knee is not None:
+        print(
+            f"Knee: concurrency {ramp_result.knee.concurrency} at "
+            + f"{ramp_result.knee.throughput:.2f} executions/s "  # noqa: W503
+            + f"with p99 {format_seconds(ramp_result.knee.p99)}",  # noqa: W503
+        )
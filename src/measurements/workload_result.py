@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+
+from measurements.measurements_stats import MeasurementsStats
+
+
+@dataclass
+class WorkloadResult:
+    """Outcome of one benchmark mode.
+
+    `elapsed` is the time in ms with at least one execution in flight, the waits
+    between executions are left out.
+    """
+
+    mode: str
+    measurements_stats: MeasurementsStats
+    elapsed: float
+    round_trips: int | None = None
+
+    @property
+    def executions(self) -> int:
+        return len(self.measurements_stats.latencies) + len(
+            self.measurements_stats.stalled_latencies,
+        )
+
+    @property
+    def throughput(self) -> float:
+        if not self.elapsed:
+            return 0
+        return self.executions / self.elapsed * 1000
+
+    @property
+    def round_trips_per_execution(self) -> float | None:
+        if self.round_trips is None or not self.executions:
+            return None
+        return self.round_trips / self.executions
+
+    def median_delta(self, baseline: "WorkloadResult") -> float:
+        return self.measurements_stats.median - baseline.measurements_stats.median
+
+    def throughput_ratio(self, baseline: "WorkloadResult") -> float:
+        if not baseline.throughput:
+            return 0
+        return self.throughput / baseline.throughput
+
+    def round_trips_saved(self, baseline: "WorkloadResult") -> float | None:
+        round_trips = self.round_trips_per_execution
+        baseline_round_trips = baseline.round_trips_per_execution
+        if round_trips is None or baseline_round_trips is None:
+            return None
+        return baseline_round_trips - round_trips
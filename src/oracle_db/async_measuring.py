@@ -0,0 +1,100 @@
+import time
+
+import oracledb
+
+from oracle_db.measuring import (
+    ROUND_TRIPS_QUERY,
+    convert_to_hard_parse_statemtent,
+)
+
+QUERY_PREFIXES = ("SELECT", "WITH")
+LEADING_CHARACTERS = "( \n\r\t"
+LINE_COMMENT_START = "--"
+BLOCK_COMMENT_START = "/*"
+BLOCK_COMMENT_END = "*/"
+
+
+def strip_leading_comments(statement: str) -> str:
+    """Drop the blanks, brackets and comments in front of the first keyword."""
+    remaining = statement.lstrip(LEADING_CHARACTERS)
+    while remaining.startswith((LINE_COMMENT_START, BLOCK_COMMENT_START)):
+        comment_end = (
+            "\n" if remaining.startswith(LINE_COMMENT_START) else BLOCK_COMMENT_END
+        )
+        remaining = remaining.partition(comment_end)[2].lstrip(LEADING_CHARACTERS)
+    return remaining
+
+
+def is_query(statement: str) -> bool:
+    """Whether the pipeline fetches the rows of a statement, like the cursor modes do."""
+    return strip_leading_comments(statement).upper().startswith(QUERY_PREFIXES)
+
+
+def create_script_pipeline(queries: list[str], hard_parse: bool) -> oracledb.Pipeline:
+    pipeline = oracledb.create_pipeline()
+    for query in queries:
+        if hard_parse:
+            query = convert_to_hard_parse_statemtent(query)
+        if is_query(query):
+            pipeline.add_fetchall(query)
+        else:
+            pipeline.add_execute(query)
+    return pipeline
+
+
+async def fetch_statement_rows_async(
+    cursor: oracledb.AsyncCursor,
+    batch_size: int,
+) -> int:
+    if not cursor.description:
+        return 0
+    if batch_size == 0:
+        return len(await cursor.fetchall())
+    affected_rows = 0
+    while True:
+        rows = await cursor.fetchmany(batch_size)
+        if not rows:
+            return affected_rows
+        affected_rows += len(rows)
+
+
+async def measure_script_execution_time_async(
+    connection: oracledb.AsyncConnection,
+    queries: list[str],
+    batch_size: int,
+    hard_parse: bool,
+) -> tuple[int, float]:
+    affected_rows = 0
+    start_time = time.perf_counter()
+    with connection.cursor() as cursor:
+        for query in queries:
+            if hard_parse:
+                query = convert_to_hard_parse_statemtent(query)
+            await cursor.execute(query)
+            affected_rows += await fetch_statement_rows_async(cursor, batch_size)
+    end_time = time.perf_counter()
+    return affected_rows, (end_time - start_time) * 1000
+
+
+async def measure_pipeline_execution_time(
+    connection: oracledb.AsyncConnection,
+    queries: list[str],
+    hard_parse: bool,
+) -> tuple[int, float]:
+    pipeline = create_script_pipeline(queries, hard_parse)
+    start_time = time.perf_counter()
+    pipeline_results = await connection.run_pipeline(pipeline)
+    end_time = time.perf_counter()
+    affected_rows = sum(
+        len(pipeline_result.rows)
+        for pipeline_result in pipeline_results
+        if pipeline_result.rows
+    )
+    return affected_rows, (end_time - start_time) * 1000
+
+
+async def fetch_round_trips_async(connection: oracledb.AsyncConnection) -> int:
+    with connection.cursor() as cursor:
+        await cursor.execute(ROUND_TRIPS_QUERY)
+        row = await cursor.fetchone()
+    return int(row[0]) if row else 0
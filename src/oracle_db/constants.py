@@ -0,0 +1,16 @@
+SYNC_MODE = "sync"
+ASYNC_MODE = "async"
+PIPELINE_MODE = "pipeline"
+COMPARE_MODE = "compare"
+WORKLOAD_MODES = (SYNC_MODE, ASYNC_MODE, PIPELINE_MODE, COMPARE_MODE)
+
+FETCHALL_STRATEGY = "fetchall"
+FETCHMANY_STRATEGY = "fetchmany"
+INLINE_LOBS_STRATEGY = "inline-lobs"
+DRAIN_STRATEGY = "drain"
+FETCH_STRATEGY_NAMES = (
+    FETCHALL_STRATEGY,
+    FETCHMANY_STRATEGY,
+    INLINE_LOBS_STRATEGY,
+    DRAIN_STRATEGY,
+)
@@ -0,0 +1,98 @@
+import time
+
+import oracledb
+
+from measurements.fetch_result import FetchResult
+from measurements.measurements_stats import MeasurementsStats
+from measurements.memory_usage import (
+    read_peak_rss,
+    reset_peak_rss,
+    trace_peak_allocations,
+)
+from oracle_db.fetch_strategies import FETCH_STRATEGIES, measure_fetch_strategy
+from output.constants import DIVIDE_OP_STR
+from output.time_format import format_seconds
+
+
+def benchmark_fetch_strategy(  # noqa: WPS210, WPS211
+    cursor: oracledb.Cursor,
+    query: str,
+    count: int,
+    wait: float,
+    batch_size: int,
+    strategy: str,
+) -> FetchResult:
+    fetch_strategy = FETCH_STRATEGIES[strategy]
+    measurements = []
+    failed_attempts = 0
+    affected_rows = 0
+
+    reset_peak_rss()
+    for execution_count in range(1, count + 1):
+        try:
+            affected_rows, _, execution_time = measure_fetch_strategy(
+                cursor,
+                query,
+                batch_size,
+                fetch_strategy,
+            )
+        except oracledb.Error as error:
+            attempt_str = f"  Attempt {execution_count}{DIVIDE_OP_STR}{count}"
+            print(f"{attempt_str}: Error - {error}")
+            failed_attempts += 1
+        else:
+            progress = f"{strategy} # {execution_count}{DIVIDE_OP_STR}{count}"
+            time_and_rows = f"{format_seconds(execution_time)}, {affected_rows} rows"
+            print(f"{progress}: {time_and_rows}")
+            measurements.append(execution_time)
+        time.sleep(wait)
+    rss_peak = read_peak_rss()
+
+    # tracemalloc slows down every allocation, so memory is traced in an extra
+    # untimed execution, which also counts the payload bytes.
+    traced_fetch, traced_peak = trace_peak_allocations(
+        lambda: measure_fetch_strategy(
+            cursor,
+            query,
+            batch_size,
+            fetch_strategy,
+            count_bytes=True,
+        ),
+    )
+    fetched_bytes = traced_fetch[1]
+
+    return FetchResult(
+        strategy=strategy,
+        measurements_stats=MeasurementsStats(measurements, failed_attempts),
+        rows=affected_rows,
+        fetched_bytes=fetched_bytes,
+        traced_peak=traced_peak,
+        rss_peak=rss_peak,
+    )
+
+
+def execute_fetch_strategies(  # noqa: WPS211
+    connection_string: str,
+    query: str,
+    count: int,
+    wait: float,
+    batch_size: int,
+    strategies: list[str],
+) -> list[FetchResult]:
+    try:
+        with oracledb.connect(connection_string) as connection:
+            with connection.cursor() as cursor:
+                return [
+                    benchmark_fetch_strategy(
+                        cursor=cursor,
+                        query=query,
+                        count=count,
+                        wait=wait,
+                        batch_size=batch_size,
+                        strategy=strategy,
+                    )
+                    for strategy in strategies
+                ]
+    except oracledb.DatabaseError as error:
+        print(f"Error: {error}")
+        exit(1)
@@ -0,0 +1,135 @@
+import time
+from types import MappingProxyType
+from typing import Callable, Mapping
+
+import oracledb
+
+from oracle_db.constants import (
+    DRAIN_STRATEGY,
+    FETCHALL_STRATEGY,
+    FETCHMANY_STRATEGY,
+    INLINE_LOBS_STRATEGY,
+)
+
+INLINE_LOB_TYPES = MappingProxyType(
+    {
+        oracledb.DB_TYPE_CLOB: oracledb.DB_TYPE_LONG,
+        oracledb.DB_TYPE_NCLOB: oracledb.DB_TYPE_LONG_NVARCHAR,
+        oracledb.DB_TYPE_BLOB: oracledb.DB_TYPE_LONG_RAW,
+    },
+)
+
+RowsAndBytes = tuple[int, int]
+FetchStrategy = Callable[[oracledb.Cursor, str, int, bool], RowsAndBytes]
+
+
+def read_row(row: tuple[object, ...], count_bytes: bool) -> int:
+    """Read the LOB locators of a row, return its payload size if `count_bytes` is set.
+
+    The payload are the character, binary and LOB values of the row.
+    """
+    size = 0
+    for column_value in row:
+        if isinstance(column_value, oracledb.LOB):
+            column_value = column_value.read()
+        if count_bytes and isinstance(column_value, (str, bytes)):
+            size += len(column_value)
+    return size
+
+
+def inline_lobs_output_type_handler(
+    cursor: oracledb.Cursor,
+    metadata: oracledb.FetchInfo,
+) -> oracledb.Var | None:
+    inline_type = INLINE_LOB_TYPES.get(metadata.type_code)
+    if inline_type is None:
+        return None
+    return cursor.var(inline_type, arraysize=cursor.arraysize)
+
+
+def fetch_all(
+    cursor: oracledb.Cursor,
+    query: str,
+    batch_size: int,
+    count_bytes: bool,
+) -> RowsAndBytes:
+    cursor.execute(query)
+    rows = cursor.fetchall()
+    return len(rows), sum(read_row(row, count_bytes) for row in rows)
+
+
+def fetch_many(
+    cursor: oracledb.Cursor,
+    query: str,
+    batch_size: int,
+    count_bytes: bool,
+) -> RowsAndBytes:
+    cursor.execute(query)
+    affected_rows = 0
+    fetched_bytes = 0
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        affected_rows += len(rows)
+        fetched_bytes += sum(read_row(row, count_bytes) for row in rows)
+    return affected_rows, fetched_bytes
+
+
+def fetch_inline_lobs(
+    cursor: oracledb.Cursor,
+    query: str,
+    batch_size: int,
+    count_bytes: bool,
+) -> RowsAndBytes:
+    previous_handler = cursor.outputtypehandler
+    cursor.outputtypehandler = inline_lobs_output_type_handler
+    try:  # noqa: WPS501
+        return fetch_many(cursor, query, batch_size, count_bytes)
+    finally:
+        cursor.outputtypehandler = previous_handler
+
+
+def drain(
+    cursor: oracledb.Cursor,
+    query: str,
+    batch_size: int,
+    count_bytes: bool,
+) -> RowsAndBytes:
+    """Only count the rows, values are discarded and LOB locators are never read."""
+    cursor.execute(query)
+    return sum(1 for _ in cursor), 0
+
+
+FETCH_STRATEGIES: Mapping[str, FetchStrategy] = MappingProxyType(
+    {
+        FETCHALL_STRATEGY: fetch_all,
+        FETCHMANY_STRATEGY: fetch_many,
+        INLINE_LOBS_STRATEGY: fetch_inline_lobs,
+        DRAIN_STRATEGY: drain,
+    },
+)
+
+
+def measure_fetch_strategy(
+    cursor: oracledb.Cursor,
+    query: str,
+    batch_size: int,
+    fetch_strategy: FetchStrategy,
+    count_bytes: bool = False,
+) -> tuple[int, int, float]:
+    """Time one fetch, the payload bytes are only counted when `count_bytes` is set.
+
+    Counting touches every fetched value, so it is left out of the timed runs and
+    the bytes come from an extra run instead.
+    """
+    cursor.arraysize = batch_size
+    start_time = time.perf_counter()
+    affected_rows, fetched_bytes = fetch_strategy(
+        cursor,
+        query,
+        batch_size,
+        count_bytes,
+    )
+    end_time = time.perf_counter()
+    return affected_rows, fetched_bytes, (end_time - start_time) * 1000
@@ -1,6 +1,18 @@
+from __future__ import annotations
+
 import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Only used for annotations, so the harness self-benchmark can drive these
+    # functions with a stub cursor where oracledb is not installed.
+    import oracledb
 
-import oracledb
+ROUND_TRIPS_QUERY = (
+    "SELECT ms.value FROM v$mystat ms"  # noqa: S608
+    + " JOIN v$statname sn ON ms.statistic# = sn.statistic#"  # noqa: W503
+    + " WHERE sn.name = 'SQL*Net roundtrips to/from client'"  # noqa: W503
+)
 
 
 def convert_to_hard_parse_statemtent(query: str) -> str:
@@ -47,3 +59,39 @@ def measure_fetchmany(
         affected_rows = affected_rows + len(rows)
     end_time = time.perf_counter()
     return affected_rows, (end_time - start_time) * 1000
+
+
+def fetch_statement_rows(cursor: oracledb.Cursor, batch_size: int) -> int:
+    if not cursor.description:
+        return 0
+    if batch_size == 0:
+        return len(cursor.fetchall())
+    affected_rows = 0
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return affected_rows
+        affected_rows += len(rows)
+
+
+def measure_script_execution_time(
+    cursor: oracledb.Cursor,
+    queries: list[str],
+    batch_size: int,
+    hard_parse: bool,
+) -> tuple[int, float]:
+    affected_rows = 0
+    start_time = time.perf_counter()
+    for query in queries:
+        if hard_parse:
+            query = convert_to_hard_parse_statemtent(query)
+        cursor.execute(query)
+        affected_rows += fetch_statement_rows(cursor, batch_size)
+    end_time = time.perf_counter()
+    return affected_rows, (end_time - start_time) * 1000
+
+
+def fetch_round_trips(cursor: oracledb.Cursor) -> int:
+    cursor.execute(ROUND_TRIPS_QUERY)
+    row = cursor.fetchone()
+    return int(row[0]) if row else 0
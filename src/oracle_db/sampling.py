@@ -0,0 +1,87 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+import oracledb
+
+from measurements.client_stalls import ClientStallMonitor
+from measurements.network_probe import NetworkProbe
+from measurements.ramp import Sampler
+from oracle_db.measuring import (
+    fetch_round_trips,
+    measure_query_execution_time,
+    measure_script_execution_time,
+)
+
+
+def measure_sample(  # noqa: WPS210, WPS211
+    cursor: oracledb.Cursor,
+    queries: list[str],
+    batch_size: int,
+    hard_parse: bool,
+    stall_monitor: ClientStallMonitor,
+    network_probe: NetworkProbe,
+) -> tuple[int, float, bool]:
+    """Time one sample, return its rows, latency and if it is excluded as stalled.
+
+    While probing the whole script is timed, so the network split covers it all.
+    The round trips of the sample are read around it if the probe counts them,
+    the read after the sample adds one round trip of its own.
+    """
+    measure = (
+        measure_script_execution_time
+        if network_probe.enabled
+        else measure_query_execution_time
+    )
+    count_round_trips = network_probe.enabled and network_probe.count_round_trips
+    round_trips_before = fetch_round_trips(cursor) if count_round_trips else 0
+    with stall_monitor.sample() as stall:
+        with network_probe.sample() as probed_sample:
+            affected_rows, execution_time = measure(
+                cursor,
+                queries,
+                batch_size,
+                hard_parse,
+            )
+    probed_sample.latency = execution_time  # noqa: WPS441
+    if count_round_trips:
+        round_trips = fetch_round_trips(cursor) - round_trips_before - 1
+        probed_sample.round_trips = max(round_trips, 1)  # noqa: WPS441
+    return affected_rows, execution_time, stall_monitor.excludes(stall)  # noqa: WPS441
+
+
+def measure_connection_sample(  # noqa: WPS211
+    connection_string: str,
+    queries: list[str],
+    batch_size: int,
+    hard_parse: bool,
+    stall_monitor: ClientStallMonitor,
+    network_probe: NetworkProbe,
+) -> tuple[int, float, bool]:
+    """Like `measure_sample` on a new connection, its setup is not timed."""
+    with oracledb.connect(connection_string) as connection:
+        with connection.cursor() as cursor:
+            return measure_sample(
+                cursor,
+                queries,
+                batch_size,
+                hard_parse,
+                stall_monitor,
+                network_probe,
+            )
+
+
+@contextmanager
+def open_ramp_session(
+    connection_string: str,
+    queries: list[str],
+    batch_size: int,
+    hard_parse: bool,
+) -> Iterator[Sampler]:
+    with oracledb.connect(connection_string) as connection:
+        with connection.cursor() as cursor:
+            yield lambda: measure_script_execution_time(
+                cursor,
+                queries,
+                batch_size,
+                hard_parse,
+            )[1]
@@ -0,0 +1,187 @@
+import time
+from functools import partial
+from typing import Callable
+
+import oracledb
+
+from measurements.client_stalls import ClientStallMonitor
+from measurements.measurements_stats import MeasurementsStats
+from measurements.network_probe import NetworkProbe
+from oracle_db.measuring import measure_query_execution_time
+from oracle_db.sampling import measure_connection_sample, measure_sample
+from output.constants import DIVIDE_OP_STR
+from output.time_format import format_seconds
+
+
+def execute_sql_stmts(  # noqa: WPS211
+    connection_string: str,
+    queries: list[str],
+    count: int,
+    wait: float,
+    batch_size: int,
+    hard_parse: bool,
+    reuse_connection: bool,
+    warmup_cache: int,
+    stall_monitor: ClientStallMonitor,
+    network_probe: NetworkProbe,
+) -> MeasurementsStats:
+
+    if reuse_connection:
+        try:
+            with oracledb.connect(
+                connection_string,
+            ) as connection:
+                with connection.cursor() as cursor:
+                    return execute_sql_stmts_w_reused_cursor(
+                        cursor=cursor,
+                        queries=queries,
+                        count=count,
+                        batch_size=batch_size,
+                        hard_parse=hard_parse,
+                        wait=wait,
+                        warmup_cache=warmup_cache,
+                        stall_monitor=stall_monitor,
+                        network_probe=network_probe,
+                    )
+        except oracledb.DatabaseError as error:
+            print(f"Error: {error}")
+            exit(1)
+    else:
+        return execute_sql_stmts_wo_reused_cursor(
+            connection_string=connection_string,
+            count=count,
+            queries=queries,
+            wait=wait,
+            batch_size=batch_size,
+            hard_parse=hard_parse,
+            warmup_cache=warmup_cache,
+            stall_monitor=stall_monitor,
+            network_probe=network_probe,
+        )
+
+
+def execute_sql_stmts_w_reused_cursor(  # noqa: WPS211
+    cursor: oracledb.Cursor,
+    queries: list[str],
+    count: int,
+    batch_size: int,
+    hard_parse: bool,
+    wait: float,
+    warmup_cache: int,
+    stall_monitor: ClientStallMonitor,
+    network_probe: NetworkProbe,
+) -> MeasurementsStats:
+    warm_up(
+        partial(measure_query_execution_time, cursor, queries, batch_size, hard_parse),
+        warmup_cache,
+        wait,
+    )
+    return measure_samples(
+        partial(
+            measure_sample,
+            cursor,
+            queries,
+            batch_size,
+            hard_parse,
+            stall_monitor,
+            network_probe,
+        ),
+        count,
+        wait,
+    )
+
+
+def execute_sql_stmts_wo_reused_cursor(  # noqa: WPS211
+    connection_string: str,
+    queries: list[str],
+    count: int,
+    wait: float,
+    batch_size: int,
+    hard_parse: bool,
+    warmup_cache: int,
+    stall_monitor: ClientStallMonitor,
+    network_probe: NetworkProbe,
+) -> MeasurementsStats:
+    try:
+        warm_up(
+            partial(
+                measure_on_new_connection,
+                connection_string,
+                queries,
+                batch_size,
+                hard_parse,
+            ),
+            warmup_cache,
+            wait,
+        )
+    except oracledb.DatabaseError as error:
+        print(f"Error: {error}")
+        exit(1)
+    return measure_samples(
+        partial(
+            measure_connection_sample,
+            connection_string,
+            queries,
+            batch_size,
+            hard_parse,
+            stall_monitor,
+            network_probe,
+        ),
+        count,
+        wait,
+    )
+
+
+def measure_on_new_connection(
+    connection_string: str,
+    queries: list[str],
+    batch_size: int,
+    hard_parse: bool,
+) -> tuple[int, float]:
+    with oracledb.connect(connection_string) as connection:
+        with connection.cursor() as cursor:
+            return measure_query_execution_time(cursor, queries, batch_size, hard_parse)
+
+
+def print_execution(progress: str, affected_rows: int, execution_time: float) -> None:
+    time_and_rows = f"{format_seconds(execution_time)}, {affected_rows} rows"
+    print(f"{progress}: {time_and_rows}")
+
+
+def warm_up(
+    measure: Callable[[], tuple[int, float]],
+    warmup_cache: int,
+    wait: float,
+) -> None:
+    for warmup_iteration in range(warmup_cache):
+        affected_rows, execution_time = measure()
+        progress = f"Warmup # {warmup_iteration}{DIVIDE_OP_STR}{warmup_cache}"
+        print_execution(progress, affected_rows, execution_time)
+        time.sleep(wait)
+
+
+def measure_samples(  # noqa: WPS210
+    measure: Callable[[], tuple[int, float, bool]],
+    count: int,
+    wait: float,
+) -> MeasurementsStats:
+    """Take `count` samples, failed ones are counted and stalled ones kept apart."""
+    measurements: list[float] = []
+    stalled_measurements: list[float] = []
+    failed_attempts = 0
+    for execution_count in range(1, count + 1):
+        try:
+            affected_rows, execution_time, excluded = measure()
+        except Exception as exception:
+            attempt_str = f"  Attempt {execution_count}{DIVIDE_OP_STR}{count}"
+            print(f"{attempt_str}: Error - {exception}")
+            failed_attempts += 1
+        else:
+            progress = f"# {execution_count}{DIVIDE_OP_STR}{count}"
+            print_execution(progress, affected_rows, execution_time)
+            if excluded:
+                stalled_measurements.append(execution_time)
+            else:
+                measurements.append(execution_time)
+        time.sleep(wait)
+    return MeasurementsStats(measurements, failed_attempts, stalled_measurements)
@@ -0,0 +1,56 @@
+import argparse
+import time
+from functools import partial
+
+from cli.arguments import SQL_COMMAND
+from connection.tns_ping import measure_single_tns_ping
+from history.recording import record_history
+from measurements.client_stalls import ClientStallMonitor
+from measurements.measurement_printing import (
+    print_client_stall_results,
+    print_measurement_results,
+)
+from measurements.network_printing import print_network_split
+from measurements.network_probe import NetworkProbe
+from oracle_db.statement_execution import execute_sql_stmts
+
+
+def run_sync_mode(
+    args: argparse.Namespace,
+    connection_string: str,
+    queries: list[str],
+    stall_monitor: ClientStallMonitor,
+    target: str,
+) -> None:
+    network_probe = NetworkProbe(
+        partial(
+            measure_single_tns_ping,
+            args.db_host,
+            args.db_port,
+            args.timeout,
+            include_conn_setup=False,
+        ),
+        interval=args.probe_interval,
+        enabled=args.probe_network,
+        count_round_trips=args.count_round_trips,
+    )
+    started_at = time.time()
+    with stall_monitor:
+        with network_probe:
+            measurements = execute_sql_stmts(
+                connection_string=connection_string,
+                queries=queries,
+                count=args.count,
+                wait=args.wait,
+                batch_size=args.batch_size,
+                hard_parse=args.hard_parse,
+                reuse_connection=args.reuse_connection,
+                warmup_cache=args.warmup_cache,
+                stall_monitor=stall_monitor,
+                network_probe=network_probe,
+            )
+
+    print_measurement_results(measurements)
+    print_client_stall_results(stall_monitor)
+    print_network_split(network_probe)
+    record_history(args, SQL_COMMAND, target, started_at, measurements, queries)
@@ -0,0 +1,89 @@
+import argparse
+import time
+
+import oracledb
+
+from cli.arguments import SQL_COMMAND
+from history.recording import get_mode_tool, record_history
+from measurements.client_stalls import ClientStallMonitor
+from measurements.measurement_printing import (
+    print_client_stall_results,
+    print_workload_comparison,
+    print_workload_results,
+)
+from measurements.workload_result import WorkloadResult
+from oracle_db.constants import (
+    ASYNC_MODE,
+    COMPARE_MODE,
+    PIPELINE_MODE,
+    SYNC_MODE,
+)
+from oracle_db.workloads import run_workload
+
+
+def execute_workload_modes(
+    args: argparse.Namespace,
+    connection_string: str,
+    queries: list[str],
+    stall_monitor: ClientStallMonitor,
+) -> list[WorkloadResult]:
+    modes = (
+        [SYNC_MODE, ASYNC_MODE, PIPELINE_MODE]
+        if args.mode == COMPARE_MODE
+        else [args.mode]
+    )
+    workload_results = []
+    for workload_mode in modes:
+        try:
+            workload_result = run_workload(
+                mode=workload_mode,
+                connection_string=connection_string,
+                queries=queries,
+                count=args.count,
+                wait=args.wait,
+                batch_size=args.batch_size,
+                warmup_cache=args.warmup_cache,
+                hard_parse=args.hard_parse,
+                count_round_trips=args.count_round_trips,
+                stall_monitor=stall_monitor,
+                coroutines=args.coroutines,
+            )
+        except oracledb.DatabaseError as error:
+            print(f"Error: {error}")
+            exit(1)
+
+        print(f"\nMode: {workload_mode}")
+        print_workload_results(workload_result)
+        workload_results.append(workload_result)
+    return workload_results
+
+
+def run_workload_modes(
+    args: argparse.Namespace,
+    connection_string: str,
+    queries: list[str],
+    stall_monitor: ClientStallMonitor,
+    target: str,
+) -> None:
+    started_at = time.time()
+    with stall_monitor:
+        workload_results = execute_workload_modes(
+            args,
+            connection_string,
+            queries,
+            stall_monitor,
+        )
+
+    if len(workload_results) > 1:
+        print_workload_comparison(workload_results)
+    print_client_stall_results(stall_monitor)
+    for workload_result in workload_results:
+        record_history(
+            args,
+            get_mode_tool(SQL_COMMAND, workload_result.mode),
+            target,
+            started_at,
+            workload_result.measurements_stats,
+            queries,
+            {"mode": workload_result.mode},
+        )
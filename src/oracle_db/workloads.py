@@ -0,0 +1,291 @@
+import asyncio
+import time
+from functools import partial
+
+import oracledb
+
+from measurements.client_stalls import ClientStallMonitor
+from measurements.measurements_stats import MeasurementsStats
+from measurements.workload_result import WorkloadResult
+from oracle_db.async_measuring import (
+    fetch_round_trips_async,
+    measure_pipeline_execution_time,
+    measure_script_execution_time_async,
+)
+from oracle_db.constants import ASYNC_MODE, PIPELINE_MODE, SYNC_MODE
+from oracle_db.measuring import fetch_round_trips, measure_script_execution_time
+from output.constants import DIVIDE_OP_STR
+from output.time_format import format_seconds
+
+
+class _WorkloadSamples:  # noqa: WPS230
+    def __init__(
+        self,
+        mode: str,
+        count: int,
+        stall_monitor: ClientStallMonitor,
+    ) -> None:
+        self.mode = mode
+        self.count = count
+        self.stall_monitor = stall_monitor
+        self.measurements: list[float] = []
+        self.stalled_measurements: list[float] = []
+        self.failed_attempts = 0
+        self.round_trips: int | None = None
+        self.busy_time: float = 0
+        self._in_flight = 0
+        self._busy_since: float = 0
+
+    def start_execution(self) -> None:
+        # Only time with at least one execution in flight counts, so the waits
+        # between executions do not water down the throughput.
+        if not self._in_flight:
+            self._busy_since = time.perf_counter()
+        self._in_flight += 1
+
+    def finish_execution(self) -> None:
+        self._in_flight -= 1
+        if not self._in_flight:
+            self.busy_time += time.perf_counter() - self._busy_since
+
+    def add_round_trips(self, round_trips: int) -> None:
+        # The statistics query itself needs one round trip.
+        self.round_trips = (self.round_trips or 0) + max(round_trips - 1, 0)
+
+    def add_success(
+        self,
+        execution_count: int,
+        affected_rows: int,
+        execution_time: float,
+        stalled: bool,
+    ) -> None:
+        progress = f"{self.mode} # {execution_count}{DIVIDE_OP_STR}{self.count}"
+        time_and_rows = f"{format_seconds(execution_time)}, {affected_rows} rows"
+        print(f"{progress}: {time_and_rows}")
+        if self.stall_monitor.exclude_stalls and stalled:
+            self.stalled_measurements.append(execution_time)
+        else:
+            self.measurements.append(execution_time)
+
+    def add_failure(self, execution_count: int, error: Exception) -> None:
+        attempt_str = f"  Attempt {execution_count}{DIVIDE_OP_STR}{self.count}"
+        print(f"{attempt_str}: Error - {error}")
+        self.failed_attempts += 1
+
+    def to_result(self) -> WorkloadResult:
+        return WorkloadResult(
+            mode=self.mode,
+            measurements_stats=MeasurementsStats(
+                self.measurements,
+                self.failed_attempts,
+                self.stalled_measurements,
+            ),
+            elapsed=self.busy_time * 1000,
+            round_trips=self.round_trips,
+        )
+
+
+def _measure_sync_samples(
+    samples: _WorkloadSamples,
+    measure: partial[tuple[int, float]],
+    wait: float,
+) -> None:
+    for execution_count in range(1, samples.count + 1):
+        samples.start_execution()
+        try:
+            with samples.stall_monitor.sample() as stall:
+                affected_rows, execution_time = measure()
+        except oracledb.Error as error:
+            samples.add_failure(execution_count, error)
+        else:
+            samples.add_success(
+                execution_count,
+                affected_rows,
+                execution_time,
+                stall.stalled,  # noqa: WPS441
+            )
+        samples.finish_execution()
+        time.sleep(wait)
+
+
+def run_sync_workload(  # noqa: WPS211
+    connection_string: str,
+    queries: list[str],
+    count: int,
+    wait: float,
+    batch_size: int,
+    warmup_cache: int,
+    hard_parse: bool,
+    count_round_trips: bool,
+    stall_monitor: ClientStallMonitor,
+) -> WorkloadResult:
+    samples = _WorkloadSamples(SYNC_MODE, count, stall_monitor)
+    with oracledb.connect(connection_string) as connection:
+        with connection.cursor() as cursor:
+            measure = partial(
+                measure_script_execution_time,
+                cursor,
+                queries,
+                batch_size,
+                hard_parse,
+            )
+            for _ in range(warmup_cache):
+                measure()
+            round_trips_before = fetch_round_trips(cursor) if count_round_trips else 0
+            _measure_sync_samples(samples, measure, wait)
+            if count_round_trips:
+                samples.add_round_trips(fetch_round_trips(cursor) - round_trips_before)
+    return samples.to_result()
+
+
+class _AsyncWorkload:  # noqa: WPS230
+    def __init__(  # noqa: WPS211
+        self,
+        connection_string: str,
+        queries: list[str],
+        batch_size: int,
+        warmup_cache: int,
+        hard_parse: bool,
+        count_round_trips: bool,
+        pipelined: bool,
+        samples: _WorkloadSamples,
+    ) -> None:
+        self.connection_string = connection_string
+        self.queries = queries
+        self.batch_size = batch_size
+        self.warmup_cache = warmup_cache
+        self.hard_parse = hard_parse
+        self.count_round_trips = count_round_trips
+        self.pipelined = pipelined
+        self.samples = samples
+
+    async def run(self, count: int, wait: float, coroutines: int) -> None:
+        # All coroutines draw from one shared iterator so `count` is the total.
+        executions = enumerate(range(count), start=1)
+        await asyncio.gather(
+            *(self.run_coroutine(executions, wait) for _ in range(coroutines)),
+        )
+
+    async def run_coroutine(self, executions: "enumerate[int]", wait: float) -> None:
+        async with oracledb.connect_async(self.connection_string) as connection:
+            for _ in range(self.warmup_cache):
+                await self.measure(connection)
+            round_trips_before = await self.fetch_round_trips(connection)
+            for execution_count, _ in executions:
+                await self.measure_sample(connection, execution_count)
+                await asyncio.sleep(wait)
+            if self.count_round_trips:
+                round_trips_after = await self.fetch_round_trips(connection)
+                self.samples.add_round_trips(round_trips_after - round_trips_before)
+
+    async def measure_sample(
+        self,
+        connection: oracledb.AsyncConnection,
+        execution_count: int,
+    ) -> None:
+        stall_monitor = self.samples.stall_monitor
+        self.samples.start_execution()
+        try:
+            with stall_monitor.sample() as stall:
+                affected_rows, execution_time = await self.measure(connection)
+        except oracledb.Error as error:
+            self.samples.add_failure(execution_count, error)
+        else:
+            self.samples.add_success(
+                execution_count,
+                affected_rows,
+                execution_time,
+                stall.stalled,  # noqa: WPS441
+            )
+        self.samples.finish_execution()
+
+    async def measure(self, connection: oracledb.AsyncConnection) -> tuple[int, float]:
+        if self.pipelined:
+            return await measure_pipeline_execution_time(
+                connection,
+                self.queries,
+                self.hard_parse,
+            )
+        return await measure_script_execution_time_async(
+            connection,
+            self.queries,
+            self.batch_size,
+            self.hard_parse,
+        )
+
+    async def fetch_round_trips(self, connection: oracledb.AsyncConnection) -> int:
+        if not self.count_round_trips:
+            return 0
+        return await fetch_round_trips_async(connection)
+
+
+def run_async_workload(  # noqa: WPS211
+    connection_string: str,
+    queries: list[str],
+    count: int,
+    wait: float,
+    batch_size: int,
+    warmup_cache: int,
+    hard_parse: bool,
+    count_round_trips: bool,
+    stall_monitor: ClientStallMonitor,
+    coroutines: int,
+    pipelined: bool,
+) -> WorkloadResult:
+    samples = _WorkloadSamples(
+        PIPELINE_MODE if pipelined else ASYNC_MODE,
+        count,
+        stall_monitor,
+    )
+    async_workload = _AsyncWorkload(
+        connection_string=connection_string,
+        queries=queries,
+        batch_size=batch_size,
+        warmup_cache=warmup_cache,
+        hard_parse=hard_parse,
+        count_round_trips=count_round_trips,
+        pipelined=pipelined,
+        samples=samples,
+    )
+    asyncio.run(async_workload.run(count, wait, coroutines))
+    return samples.to_result()
+
+
+def run_workload(  # noqa: WPS211
+    mode: str,
+    connection_string: str,
+    queries: list[str],
+    count: int,
+    wait: float,
+    batch_size: int,
+    warmup_cache: int,
+    hard_parse: bool,
+    count_round_trips: bool,
+    stall_monitor: ClientStallMonitor,
+    coroutines: int,
+) -> WorkloadResult:
+    if mode == SYNC_MODE:
+        return run_sync_workload(
+            connection_string=connection_string,
+            queries=queries,
+            count=count,
+            wait=wait,
+            batch_size=batch_size,
+            warmup_cache=warmup_cache,
+            hard_parse=hard_parse,
+            count_round_trips=count_round_trips,
+            stall_monitor=stall_monitor,
+        )
+    return run_async_workload(
+        connection_string=connection_string,
+        queries=queries,
+        count=count,
+        wait=wait,
+        batch_size=batch_size,
+        warmup_cache=warmup_cache,
+        hard_parse=hard_parse,
+        count_round_trips=count_round_trips,
+        stall_monitor=stall_monitor,
+        coroutines=coroutines,
+        pipelined=mode == PIPELINE_MODE,
+    )
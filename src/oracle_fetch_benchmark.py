@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+import argparse
+import getpass
+
+from cli.arguments import FETCH_DESCRIPTION, configure_fetch_arguments
+from measurements.measurement_printing import print_fetch_results
+from oracle_db.connection_string import get_connection_string
+from oracle_db.fetch_execution import execute_fetch_strategies
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=FETCH_DESCRIPTION)
+    configure_fetch_arguments(parser)
+    return parser.parse_args()
+
+
+def run(args: argparse.Namespace) -> None:
+    db_pass = getpass.getpass("Enter password: ")
+
+    print(
+        f"Measuring fetch strategies for {args.db_host}:{args.db_port}/{args.db_service}",
+    )
+    print(f"  Timeout: {args.timeout}s")
+    print(f"  Count: {args.count}")
+    print(f"  Wait: {args.wait}s")
+    print(f"  Batch size: {args.batch_size}")
+    print(f"  Strategies: {', '.join(args.strategies)}")
+    print()
+
+    fetch_results = execute_fetch_strategies(
+        connection_string=get_connection_string(
+            db_host=args.db_host,
+            db_service=args.db_service,
+            db_user=args.db_user,
+            db_pass=db_pass,
+            db_port=args.db_port,
+            timeout=args.timeout,
+        ),
+        query=args.query,
+        count=args.count,
+        wait=args.wait,
+        batch_size=args.batch_size,
+        strategies=args.strategies,
+    )
+
+    print_fetch_results(fetch_results)
+
+
+def main() -> None:
+    run(parse_arguments())
+
+
+if __name__ == "__main__":
+    main()
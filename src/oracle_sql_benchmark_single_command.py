@@ -5,7 +5,7 @@ import time
 
 import oracledb
 
-from connection.constants import DEFAULT_ORACLEDB_PORT
+from cli.arguments import SQL_SINGLE_DESCRIPTION, configure_sql_single_arguments
 from output.time_format import format_seconds
 from sql.sql_file_reader import parse_sql_file
 
@@ -65,60 +65,12 @@ def execute_sql_stmt(
 
 
 def parse_arguments() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Measure SQL query time")
-    parser.add_argument("db_host", type=str, help="Target hostname or IP address")
-    parser.add_argument("db_service", type=str, help="Service name of the target db")
-    parser.add_argument("db_user", type=str, help="DB username")
-    parser.add_argument(
-        "-q",
-        "--query",
-        type=str,
-        default="SELECT SYSDATE FROM DUAL",
-        help="The SQL statement to execute (default: SELECT SYSDATE FROM DUAL)",
-    )
-    parser.add_argument(
-        "-p",
-        "--db-port",
-        type=int,
-        default=DEFAULT_ORACLEDB_PORT,
-        help=f"The port the DB is listening on (default: {DEFAULT_ORACLEDB_PORT})",
-    )
-    parser.add_argument(
-        "-t",
-        "--timeout",
-        type=float,
-        default=2,
-        help="Socket timeout in seconds (default: 2)",
-    )
-    parser.add_argument(
-        "-b",
-        "--batch-size",
-        type=int,
-        default=0,
-        help="The batch size for fetchmany(). If it is 0 fetchall is called (default: 0)",
-    )
-
-    parser.add_argument(
-        "-f",
-        "--file",
-        type=str,
-        help=("Path to an file that contains multiple SQL statements to execute"),
-    )
-
-    parser.add_argument(
-        "-hp",
-        "--hard-parse",
-        action="store_true",
-        default=False,
-        help="Force hard parse (default: false)",
-    )
-
+    parser = argparse.ArgumentParser(description=SQL_SINGLE_DESCRIPTION)
+    configure_sql_single_arguments(parser)
     return parser.parse_args()
 
 
-def main() -> None:
-    args = parse_arguments()
-
+def run(args: argparse.Namespace) -> None:
     query = parse_sql_file(args.file) if args.file else args.query
 
     db_pass = getpass.getpass("Enter password: ")
@@ -144,5 +96,9 @@ def main() -> None:
     )
 
 
+def main() -> None:
+    run(parse_arguments())
+
+
 if __name__ == "__main__":
     main()
@@ -1,56 +1,21 @@
 import argparse
-import re
 import socket
 import time
 
-from measurements.measurement_printing import print_measurement_results
-from measurements.measurements_stats import MeasurementsStats
-from output.time_format import format_seconds
-from connection.constants import (
-    DEFAULT_ORACLEDB_PORT,
-    DEFAULT_RECEIVE_BUFFER_SIZE,
+from cli.arguments import (
+    TNSPING_COMMAND,
+    TNSPING_DESCRIPTION,
+    configure_tnsping_arguments,
 )
-
-packet = (
-    b"\x00W\x00\x00\x01\x00\x00\x00\x018\x01,\x00\x00\x08\x00\x7f\xff"
-    + b"\x7f\x08\x00\x00\x01\x00\x00\x1d\x00:\x00\x00\x00\x00\x00\x00"  # noqa: W503
-    + b"\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x190\x00\x00\x00\x8d"  # noqa: W503
-    + b"\x00\x00\x00\x00\x00\x00\x00\x00(CONNECT_DATA=(COMMAND=ping))"  # noqa: W503
+from connection.tns_ping import measure_single_tns_ping
+from history.recording import record_history
+from measurements.client_stalls import ClientStallMonitor
+from measurements.measurement_printing import (
+    print_client_stall_results,
+    print_measurement_results,
 )
-
-pattern = r"\(DESCRIPTION=\(TMP=\)\(VSNNUM=0\)\(ERR=0\)\(ALIAS=.*?\)\)"
-
-
-def measure_single_tns_ping(
-    host: str,
-    port: int,
-    timeout: float,
-    include_conn_setup: bool,
-) -> float:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as tcp_socket:
-        tcp_socket.settimeout(timeout)
-        received = "no data"
-
-        if include_conn_setup:
-            start_time = time.perf_counter()
-        tcp_socket.connect((host, port))
-        if not include_conn_setup:
-            start_time = time.perf_counter()
-
-        tcp_socket.send(packet)
-        while True:
-            received_data = tcp_socket.recv(DEFAULT_RECEIVE_BUFFER_SIZE)
-            if not received_data:
-                break
-            received = received_data[12:].decode()  # noqa: WPS432
-
-        end_time = time.perf_counter()
-        tcp_socket.close()
-
-        if not re.match(pattern, received):
-            raise ValueError(f"Wrong TNSPing answer received: {received}")
-
-        return (end_time - start_time) * 1000
+from measurements.measurements_stats import MeasurementsStats
+from output.time_format import format_seconds
 
 
 def measure_tns_pings(
@@ -60,18 +25,22 @@ def measure_tns_pings(
     timeout,
     wait,
     include_conn_setup=False,
+    stall_monitor: ClientStallMonitor | None = None,
 ) -> MeasurementsStats:
+    stall_monitor = stall_monitor or ClientStallMonitor(enabled=False)
     measurements = []
+    stalled_measurements = []
     failed_attempts = 0
 
     for attempt_index in range(count):
         try:
-            measurement = measure_single_tns_ping(
-                host,
-                port,
-                timeout,
-                include_conn_setup,
-            )
+            with stall_monitor.sample() as stall:
+                measurement = measure_single_tns_ping(
+                    host,
+                    port,
+                    timeout,
+                    include_conn_setup,
+                )
         except socket.timeout:
             print(
                 f"  Attempt {attempt_index+1}/{count}: Timed out after {timeout} seconds",
@@ -85,62 +54,25 @@ def measure_tns_pings(
             time.sleep(wait)
 
         else:
-            measurements.append(measurement)
+            if stall_monitor.excludes(stall):  # noqa: WPS441
+                stalled_measurements.append(measurement)
+            else:
+                measurements.append(measurement)
             attempt_str = f"  Attempt {attempt_index+1}/{count}"
             latency_str = f"{format_seconds(measurement)}."
             print(f"{attempt_str}: {latency_str}")
             time.sleep(wait)
 
-    if measurements:
-        return MeasurementsStats(measurements)
-    return MeasurementsStats([])
+    return MeasurementsStats(measurements, failed_attempts, stalled_measurements)
 
 
 def parse_arguments() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Measure network latency to a host")
-    parser.add_argument("host", type=str, help="Target hostname or IP address")
-    parser.add_argument(
-        "-p",
-        "--port",
-        type=int,
-        default=DEFAULT_ORACLEDB_PORT,
-        help=f"Target port number (default: {DEFAULT_ORACLEDB_PORT})",
-    )
-    parser.add_argument(
-        "-c",
-        "--count",
-        type=int,
-        default=10,
-        help="Number of measurements to take (default: 10)",
-    )
-    parser.add_argument(
-        "-t",
-        "--timeout",
-        type=float,
-        default=2,
-        help="Socket timeout in seconds (default: 2)",
-    )
-    parser.add_argument(
-        "-w",
-        "--wait",
-        type=float,
-        default=0.5,
-        help="Wait time between each attempt (default: 0.5)",
-    )
-    parser.add_argument(
-        "-i",
-        "--include-conn-setup",
-        action="store_true",
-        default=False,
-        help="Include the connection setup before sending the ping into the measurement? (default: False)",
-    )
-
+    parser = argparse.ArgumentParser(description=TNSPING_DESCRIPTION)
+    configure_tnsping_arguments(parser)
     return parser.parse_args()
 
 
-def main() -> None:
-    args = parse_arguments()
-
+def run(args: argparse.Namespace) -> None:
     print(f"Measuring TNS Ping towards {args.host}:{args.port}")
     print(f"  Count: {args.count}")
     print(f"  Timeout: {args.timeout}s")
@@ -148,16 +80,36 @@ def main() -> None:
     print(f"  Include connection setup: {args.include_conn_setup}")
     print()
 
-    measurements = measure_tns_pings(
-        args.host,
-        args.port,
-        args.count,
-        args.timeout,
-        args.wait,
-        args.include_conn_setup,
+    stall_monitor = ClientStallMonitor(
+        enabled=args.detect_stalls or args.exclude_stalls,
+        stall_threshold=args.stall_threshold,
+        exclude_stalls=args.exclude_stalls,
     )
+    started_at = time.time()
+    with stall_monitor:
+        measurements = measure_tns_pings(
+            args.host,
+            args.port,
+            args.count,
+            args.timeout,
+            args.wait,
+            args.include_conn_setup,
+            stall_monitor,
+        )
 
     print_measurement_results(measurements)
+    print_client_stall_results(stall_monitor)
+    record_history(
+        args,
+        TNSPING_COMMAND,
+        f"{args.host}:{args.port}",
+        started_at,
+        measurements,
+    )
+
+
+def main() -> None:
+    run(parse_arguments())
 
 
 if __name__ == "__main__":
@@ -1,2 +1,3 @@
 TIME_UNIT_STR = "ms"
+MICRO_TIME_UNIT_STR = "us"
 DIVIDE_OP_STR = "/"
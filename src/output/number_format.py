@@ -0,0 +1,2 @@
+def format_decimal(number: float) -> str:
+    return f"{number:.2f}"
@@ -0,0 +1,10 @@
+SIZE_UNITS = ("B", "KiB", "MiB", "GiB")
+SIZE_UNIT_STEP = 1024
+
+
+def format_bytes(size: float) -> str:
+    for unit in SIZE_UNITS[:-1]:
+        if abs(size) < SIZE_UNIT_STEP:
+            return f"{size:.2f}{unit}"
+        size /= SIZE_UNIT_STEP
+    return f"{size:.2f}{SIZE_UNITS[-1]}"
@@ -1,5 +1,9 @@
-from output.constants import TIME_UNIT_STR
+from output.constants import MICRO_TIME_UNIT_STR, TIME_UNIT_STR
 
 
 def format_seconds(seconds) -> str:
     return f"{seconds:.2f}{TIME_UNIT_STR}"
+
+
+def format_microseconds(milliseconds: float) -> str:
+    return f"{milliseconds * 1000:.2f}{MICRO_TIME_UNIT_STR}"
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+import argparse
+import time
+
+from cli.arguments import HISTORY_DESCRIPTION, SQL_COMMAND
+from cli.tool_arguments import configure_history_arguments
+from history.constants import (
+    BUCKET_SECONDS,
+    SECONDS_PER_DAY,
+    STATEMENT_HISTORY_MODE,
+)
+from history.recording import get_mode_tool
+from history.store import RunHistoryStore, RunSummary
+from history.trends import TrendPoint, summarize_trend
+from output.constants import DIVIDE_OP_STR
+from output.time_format import format_seconds
+
+BUCKET_TIME_FORMAT = "%Y-%m-%d %H:%M"  # noqa: WPS323
+
+
+def print_trend(trend_points: list[TrendPoint]) -> None:
+    print("\nTrend:")
+    if not trend_points:
+        print("  No runs found")
+    for trend_point in trend_points:
+        histogram = trend_point.histogram
+        bucket_start = time.strftime(
+            BUCKET_TIME_FORMAT,
+            time.gmtime(trend_point.bucket_start),
+        )
+        percentiles = ", ".join(
+            f"p{percent} {format_seconds(histogram.percentile(percent))}"
+            for percent in (50, 90, 99)
+        )
+        successful = trend_point.attempts - trend_point.failed_attempts
+        print(
+            f"  {bucket_start}: {trend_point.runs} runs, {percentiles}, "
+            + f"max {format_seconds(histogram.max)}, "  # noqa: W503
+            + f"success {successful}{DIVIDE_OP_STR}{trend_point.attempts}",  # noqa: W503
+        )
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=HISTORY_DESCRIPTION)
+    configure_history_arguments(parser)
+    return parser.parse_args()
+
+
+def select_tool(args: argparse.Namespace) -> str | None:
+    """Tool to filter on, a workload mode picks the runs of that mode only.
+
+    Plain sql runs time each statement and are stored under the bare tool name,
+    workload runs time the whole script and carry their mode in the tool name.
+    """
+    if args.mode == STATEMENT_HISTORY_MODE:
+        return args.tool or SQL_COMMAND
+    if args.mode:
+        return get_mode_tool(args.tool or SQL_COMMAND, args.mode)
+    return args.tool
+
+
+def load_run_summaries(args: argparse.Namespace, tool: str | None) -> list[RunSummary]:
+    with RunHistoryStore(args.history_db) as history_store:
+        return history_store.query_run_summaries(
+            target=args.target,
+            since=time.time() - args.days * SECONDS_PER_DAY,
+            tool=tool,
+            statement_hash=args.statement_hash,
+        )
+
+
+def run(args: argparse.Namespace) -> None:
+    tool = select_tool(args)
+    print(f"Latency trend for {args.target} from {args.history_db}")
+    print(f"  Tool: {tool or 'all'}")
+    print(f"  Statement hash: {args.statement_hash or 'all'}")
+    print(f"  Days: {args.days}")
+    print(f"  Bucket: {args.bucket} (UTC)")
+
+    query_start = time.perf_counter()
+    run_summaries = load_run_summaries(args, tool)
+    trend_points = summarize_trend(run_summaries, BUCKET_SECONDS[args.bucket])
+    query_time = (time.perf_counter() - query_start) * 1000
+
+    print_trend(trend_points)
+    print(f"\n{len(run_summaries)} runs summarized in {format_seconds(query_time)}")
+
+
+def main() -> None:
+    run(parse_arguments())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import os
+import random
+import tempfile
+import time
+from typing import Callable
+
+from measurements.client_stalls import ClientStallMonitor
+from measurements.measurements_stats import MeasurementsStats
+from oracle_db.measuring import measure_query_execution_time
+from selfbench.network_cases import (
+    bench_single_tns_ping,
+    bench_socket_latency,
+    bench_tns_pings,
+)
+from selfbench.results import SelfBenchResult
+from selfbench.stand_ins import StubCursor
+from sql.sql_file_reader import parse_sql_file
+
+STUB_ROWS = 1000
+STUB_BATCH_SIZE = 100
+RANDOM_SEED = 42
+SQL_STATEMENT = (
+    "SELECT o.order_id, c.name FROM orders o"  # noqa: S608
+    + " JOIN customers c ON o.cust_id = c.cust_id"  # noqa: W503
+    + " WHERE o.order_date > SYSDATE - 30;\n"  # noqa: W503
+)
+
+BenchCase = Callable[[int], SelfBenchResult]
+
+
+def bench_measurements_stats(samples: int) -> SelfBenchResult:
+    generator = random.Random(RANDOM_SEED)  # noqa: S311
+    latencies = [generator.expovariate(1) for _ in range(samples)]
+    start_time = time.perf_counter()
+    MeasurementsStats(latencies)
+    elapsed = (time.perf_counter() - start_time) * 1000
+    return SelfBenchResult("measurements_stats", samples, elapsed)
+
+
+def bench_stall_monitor(samples: int) -> SelfBenchResult:
+    with ClientStallMonitor() as stall_monitor:
+        start_time = time.perf_counter()
+        for _ in range(samples):
+            with stall_monitor.sample():  # noqa: WPS328
+                pass  # noqa: WPS420
+        elapsed = (time.perf_counter() - start_time) * 1000
+    return SelfBenchResult("stall_monitor_sample", samples, elapsed)
+
+
+def bench_parse_sql_file(statements: int) -> SelfBenchResult:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "script.sql")
+        with open(file_path, "w") as script_file:
+            script_file.write(SQL_STATEMENT * statements)
+        start_time = time.perf_counter()
+        parse_sql_file(file_path)
+        end_time = time.perf_counter()
+    return SelfBenchResult("parse_sql_file", statements, (end_time - start_time) * 1000)
+
+
+def bench_stub_fetchmany(count: int) -> SelfBenchResult:
+    cursor = StubCursor([(row_index, "row") for row_index in range(STUB_ROWS)])
+    measured: float = 0
+    start_time = time.perf_counter()
+    for _ in range(count):
+        _, execution_time = measure_query_execution_time(
+            cursor,  # type: ignore[arg-type]
+            [SQL_STATEMENT],
+            STUB_BATCH_SIZE,
+            hard_parse=False,
+        )
+        measured += execution_time
+    end_time = time.perf_counter()
+    return SelfBenchResult(
+        "stub_cursor_fetchmany",
+        count,
+        (end_time - start_time) * 1000,
+        measured,
+    )
+
+
+def run_case(bench_case: BenchCase, size: int, repeat: int) -> SelfBenchResult:
+    """Median of `repeat` runs, a single lucky or disturbed run does not move it."""
+    self_bench_results = sorted(
+        (bench_case(size) for _ in range(repeat)),
+        key=lambda self_bench_result: self_bench_result.compared_per_operation,
+    )
+    return self_bench_results[(len(self_bench_results) - 1) // 2]
+
+
+def run_suite(
+    samples: int,
+    statements: int,
+    count: int,
+    repeat: int,
+) -> list[SelfBenchResult]:
+    bench_cases: list[tuple[BenchCase, int]] = [
+        (bench_measurements_stats, samples),
+        (bench_stall_monitor, samples),
+        (bench_parse_sql_file, statements),
+        (bench_single_tns_ping, count),
+        (bench_tns_pings, count),
+        (bench_socket_latency, count),
+        (bench_stub_fetchmany, count),
+    ]
+    return [run_case(bench_case, size, repeat) for bench_case, size in bench_cases]
@@ -0,0 +1,74 @@
+import os
+import time
+from contextlib import redirect_stdout
+
+from connection.tns_ping import measure_single_tns_ping
+from oracle_tnsping_benchmark import measure_tns_pings
+from selfbench.results import SelfBenchResult
+from selfbench.stand_ins import FakeTnsListener, LocalTcpServer
+from socket_benchmark import measure_latency
+
+STAND_IN_TIMEOUT = 2
+
+
+def bench_single_tns_ping(count: int) -> SelfBenchResult:
+    with FakeTnsListener() as listener:
+        start_time = time.perf_counter()
+        measured = sum(
+            measure_single_tns_ping(
+                listener.host,
+                listener.port,
+                STAND_IN_TIMEOUT,
+                include_conn_setup=False,
+            )
+            for _ in range(count)
+        )
+        end_time = time.perf_counter()
+    return SelfBenchResult(
+        "measure_single_tns_ping",
+        count,
+        (end_time - start_time) * 1000,
+        measured,
+    )
+
+
+def bench_tns_pings(count: int) -> SelfBenchResult:
+    with FakeTnsListener() as listener:
+        with open(os.devnull, "w") as devnull:
+            with redirect_stdout(devnull):
+                start_time = time.perf_counter()
+                measurements = measure_tns_pings(
+                    listener.host,
+                    listener.port,
+                    count,
+                    STAND_IN_TIMEOUT,
+                    0,
+                )
+                end_time = time.perf_counter()
+    return SelfBenchResult(
+        "measure_tns_pings",
+        count,
+        (end_time - start_time) * 1000,
+        sum(measurements.latencies),
+    )
+
+
+def bench_socket_latency(count: int) -> SelfBenchResult:
+    with LocalTcpServer() as server:
+        with open(os.devnull, "w") as devnull:
+            with redirect_stdout(devnull):
+                start_time = time.perf_counter()
+                measurements = measure_latency(
+                    server.host,
+                    server.port,
+                    count,
+                    STAND_IN_TIMEOUT,
+                    0,
+                )
+                end_time = time.perf_counter()
+    return SelfBenchResult(
+        "socket_measure_latency",
+        count,
+        (end_time - start_time) * 1000,
+        sum(measurements.latencies),
+    )
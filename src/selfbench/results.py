@@ -0,0 +1,102 @@
+import json
+from dataclasses import asdict, dataclass
+
+
+@dataclass
+class SelfBenchResult:
+    """Median run of one harness benchmark case, times in milliseconds.
+
+    `measured` is the part of `elapsed` that the harness reported as latency, for
+    cases that time a request. The remainder is the harness' own overhead.
+    """
+
+    name: str
+    operations: int
+    elapsed: float
+    measured: float = 0
+
+    @property
+    def per_operation(self) -> float:
+        return self.elapsed / self.operations if self.operations else 0
+
+    @property
+    def overhead_per_operation(self) -> float:
+        if not self.operations:
+            return 0
+        return (self.elapsed - self.measured) / self.operations
+
+    @property
+    def compared_per_operation(self) -> float:
+        """Time per operation a baseline is compared on, the overhead if measured.
+
+        The latency of the stand-in servers varies with the host, so only the
+        harness' own overhead tells whether the harness got slower.
+        """
+        return self.overhead_per_operation if self.measured else self.per_operation
+
+    @property
+    def throughput(self) -> float:
+        return self.operations / self.elapsed * 1000 if self.elapsed else 0
+
+
+def save_results(file_path: str, bench_results: list[SelfBenchResult]) -> None:
+    with open(file_path, "w") as results_file:
+        json.dump(
+            [asdict(bench_result) for bench_result in bench_results],
+            results_file,
+            indent=2,
+        )
+
+
+def load_results(file_path: str) -> dict[str, SelfBenchResult]:
+    try:
+        with open(file_path, "r") as results_file:
+            stored_results = json.load(results_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"The file '{file_path}' was not found.")
+    return {
+        stored_result["name"]: SelfBenchResult(**stored_result)
+        for stored_result in stored_results
+    }
+
+
+def _paired_results(
+    bench_results: list[SelfBenchResult],
+    baseline: dict[str, SelfBenchResult],
+) -> list[tuple[SelfBenchResult, SelfBenchResult]]:
+    return [
+        (bench_result, baseline[bench_result.name])
+        for bench_result in bench_results
+        if bench_result.name in baseline
+    ]
+
+
+def find_size_mismatches(
+    bench_results: list[SelfBenchResult],
+    baseline: dict[str, SelfBenchResult],
+) -> list[tuple[SelfBenchResult, SelfBenchResult]]:
+    """Pairs of (result, baseline) run with a different number of operations.
+
+    Costs like sorting the samples do not grow linearly, so their times per
+    operation cannot be compared.
+    """
+    return [
+        (bench_result, baseline_result)
+        for bench_result, baseline_result in _paired_results(bench_results, baseline)
+        if bench_result.operations != baseline_result.operations
+    ]
+
+
+def find_regressions(
+    bench_results: list[SelfBenchResult],
+    baseline: dict[str, SelfBenchResult],
+    tolerance: float,
+) -> list[tuple[SelfBenchResult, SelfBenchResult]]:
+    """Pairs of (result, baseline) whose compared time grew above `tolerance` %."""
+    regressions = []
+    for bench_result, baseline_result in _paired_results(bench_results, baseline):
+        allowed = baseline_result.compared_per_operation * (1 + tolerance / 100)
+        same_size = bench_result.operations == baseline_result.operations
+        if same_size and bench_result.compared_per_operation > allowed:
+            regressions.append((bench_result, baseline_result))
+    return regressions
@@ -0,0 +1,80 @@
+import socket
+import threading
+
+LOCALHOST = "127.0.0.1"
+LISTEN_BACKLOG = 128
+ACCEPT_TIMEOUT = 0.1
+TNS_HEADER_SIZE = 12
+TNS_PING_ANSWER = b"(DESCRIPTION=(TMP=)(VSNNUM=0)(ERR=0)(ALIAS=LISTENER))"
+DEFAULT_RECEIVE_SIZE = 4096
+
+
+class LocalTcpServer:
+    """TCP server on localhost that accepts connections and closes them right away."""
+
+    def __init__(self) -> None:
+        self._listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._listener.bind((LOCALHOST, 0))
+        self._listener.listen(LISTEN_BACKLOG)
+        self._listener.settimeout(ACCEPT_TIMEOUT)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    def __enter__(self) -> "LocalTcpServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._stop_event.set()
+        self._thread.join()
+        self._listener.close()
+
+    @property
+    def host(self) -> str:
+        return LOCALHOST
+
+    @property
+    def port(self) -> int:
+        return int(self._listener.getsockname()[1])
+
+    def serve_connection(self, connection: socket.socket) -> None:
+        """Called for every accepted connection, which is closed afterwards."""
+
+    def _serve(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                connection, _ = self._listener.accept()
+            except socket.timeout:
+                continue
+            with connection:
+                self.serve_connection(connection)
+
+
+class FakeTnsListener(LocalTcpServer):
+    """Answers every request with a successful TNS ping response."""
+
+    def serve_connection(self, connection: socket.socket) -> None:
+        connection.recv(DEFAULT_RECEIVE_SIZE)
+        connection.sendall(b"\x00" * TNS_HEADER_SIZE + TNS_PING_ANSWER)
+
+
+class StubCursor:
+    """Cursor double returning the same rows for every query, without any I/O."""
+
+    def __init__(self, rows: list[tuple[object, ...]]) -> None:
+        self.rows = rows
+        self.description: list[tuple[str]] | None = None
+        self._position = 0
+
+    def execute(self, query: str) -> None:
+        self.description = [("COLUMN",)]
+        self._position = 0
+
+    def fetchall(self) -> list[tuple[object, ...]]:
+        return self.fetchmany(len(self.rows))
+
+    def fetchmany(self, batch_size: int) -> list[tuple[object, ...]]:
+        batch = self.rows[self._position : self._position + batch_size]
+        self._position += len(batch)
+        return batch
@@ -2,21 +2,35 @@ import argparse
 import socket
 import time
 
-from measurements.measurement_printing import print_measurement_results
+from cli.arguments import (
+    SOCKET_COMMAND,
+    SOCKET_DESCRIPTION,
+    configure_socket_arguments,
+)
+from connection.tcp_connect import open_connect_session
+from history.recording import record_history
+from measurements.client_stalls import ClientStallMonitor
+from measurements.measurement_printing import (
+    print_client_stall_results,
+    print_measurement_results,
+)
 from measurements.measurements_stats import MeasurementsStats
+from measurements.ramp_mode import run_ramp_mode
 from output.constants import DIVIDE_OP_STR
 from output.time_format import format_seconds
-from connection.constants import DEFAULT_HTTP_PORT
 
 
-def measure_latency(  # noqa: WPS210, WPS213
+def measure_latency(  # noqa: WPS210, WPS211, WPS213
     host,
     port,
     count,
     timeout,
     wait,
+    stall_monitor: ClientStallMonitor | None = None,
 ) -> MeasurementsStats:
+    stall_monitor = stall_monitor or ClientStallMonitor(enabled=False)
     measurements: list[float] = []
+    stalled_measurements: list[float] = []
     failed_attempts = 0
 
     for attempt_index in range(count):
@@ -24,16 +38,20 @@ def measure_latency(  # noqa: WPS210, WPS213
             with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as socket_instance:
                 socket_instance.settimeout(timeout)
 
-                start_time = time.perf_counter()
+                with stall_monitor.sample() as stall:
+                    start_time = time.perf_counter()
 
-                socket_instance.connect((host, port))
+                    socket_instance.connect((host, port))
 
-                end_time = time.perf_counter()
+                    end_time = time.perf_counter()
 
                 socket_instance.close()
 
                 latency = (end_time - start_time) * 1000
-                measurements.append(latency)
+                if stall_monitor.excludes(stall):  # noqa: WPS441
+                    stalled_measurements.append(latency)
+                else:
+                    measurements.append(latency)
 
                 attempt_str = f"  Attempt {attempt_index+1}{DIVIDE_OP_STR}{count}"
                 latency_str = f"{format_seconds(latency)}"
@@ -56,63 +74,61 @@ def measure_latency(  # noqa: WPS210, WPS213
     return MeasurementsStats(
         measurements,
         failed_attempts,
+        stalled_measurements,
     )
 
 
 def parse_arguments() -> argparse.Namespace:
-    parser = argparse.ArgumentParser(description="Measure network latency to a host")
-    parser.add_argument("host", type=str, help="Target hostname or IP address")
-    parser.add_argument(
-        "-p",
-        "--port",
-        type=int,
-        default=DEFAULT_HTTP_PORT,
-        help=f"Target port number (default: {DEFAULT_HTTP_PORT})",
-    )
-    parser.add_argument(
-        "-c",
-        "--count",
-        type=int,
-        default=10,
-        help="Number of measurements to take (default: 10)",
-    )
-    parser.add_argument(
-        "-t",
-        "--timeout",
-        type=float,
-        default=2,
-        help="Socket timeout in seconds (default: 2)",
-    )
-    parser.add_argument(
-        "-w",
-        "--wait",
-        type=float,
-        default=0.5,
-        help="Wait time between each attempt (default: 0.5)",
-    )
+    parser = argparse.ArgumentParser(description=SOCKET_DESCRIPTION)
+    configure_socket_arguments(parser)
     return parser.parse_args()
 
 
-def main() -> None:
-    args = parse_arguments()
-
+def run(args: argparse.Namespace) -> None:
     print(
         f"Measuring socket connection to {args.host}:{args.port}",
     )
-    print(f"  Count: {args.count}")
     print(f"  Timeout: {args.timeout}s")
+    if args.ramp:
+        run_ramp_mode(
+            args,
+            lambda: open_connect_session(args.host, args.port, args.timeout),
+            "concurrency",
+        )
+        return
+    print(f"  Count: {args.count}")
     print(f"  Wait: {args.wait}s")
     print()
 
-    measurement_results = measure_latency(
-        args.host,
-        args.port,
-        args.count,
-        args.timeout,
-        args.wait,
+    stall_monitor = ClientStallMonitor(
+        enabled=args.detect_stalls or args.exclude_stalls,
+        stall_threshold=args.stall_threshold,
+        exclude_stalls=args.exclude_stalls,
     )
+    started_at = time.time()
+    with stall_monitor:
+        measurement_results = measure_latency(
+            args.host,
+            args.port,
+            args.count,
+            args.timeout,
+            args.wait,
+            stall_monitor,
+        )
 
     print_measurement_results(measurement_results)
+    print_client_stall_results(stall_monitor)
+    record_history(
+        args,
+        SOCKET_COMMAND,
+        f"{args.host}:{args.port}",
+        started_at,
+        measurement_results,
+    )
+
+
+def main() -> None:
+    run(parse_arguments())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,44 @@
+import os
+import subprocess  # noqa: S404
+import sys
+import time
+
+BENCH_SCRIPT = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "bench.py",
+)
+HEAVY_MODULES = ("oracledb",)
+IMPORT_TIME_PREFIX = "import time:"
+IMPORT_TIME_SEPARATOR = "|"
+
+
+def get_bench_command(arguments: list[str], *interpreter_options: str) -> list[str]:
+    return [sys.executable, *interpreter_options, BENCH_SCRIPT, *arguments]
+
+
+def measure_cold_start(arguments: list[str]) -> float:
+    start_time = time.perf_counter()
+    subprocess.run(  # noqa: S603
+        get_bench_command(arguments),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=True,
+    )
+    end_time = time.perf_counter()
+    return (end_time - start_time) * 1000
+
+
+def find_heavy_imports(arguments: list[str]) -> list[str]:
+    completed = subprocess.run(  # noqa: S603
+        get_bench_command(arguments, "-X", "importtime"),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=True,
+    )
+    imported_packages = set()
+    for line in completed.stderr.splitlines():
+        if line.startswith(IMPORT_TIME_PREFIX):
+            module_name = line.rsplit(IMPORT_TIME_SEPARATOR, 1)[-1].strip()
+            imported_packages.add(module_name.split(".")[0])
+    return [module for module in HEAVY_MODULES if module in imported_packages]
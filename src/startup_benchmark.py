@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+import argparse
+import shlex
+import subprocess  # noqa: S404
+
+from cli.arguments import STARTUP_DESCRIPTION
+from cli.tool_arguments import configure_startup_arguments
+from measurements.measurement_printing import print_measurement_results
+from measurements.measurements_stats import MeasurementsStats
+from output.constants import DIVIDE_OP_STR
+from output.time_format import format_seconds
+from startup.cold_start import (
+    BENCH_SCRIPT,
+    find_heavy_imports,
+    measure_cold_start,
+)
+
+
+def measure_scenario(arguments: list[str], count: int) -> MeasurementsStats:
+    measurements = []
+    failed_attempts = 0
+    for attempt_index in range(1, count + 1):
+        attempt_str = f"  Attempt {attempt_index}{DIVIDE_OP_STR}{count}"
+        try:
+            startup_time = measure_cold_start(arguments)
+        except subprocess.CalledProcessError as error:
+            print(f"{attempt_str}: Error - {error}")
+            failed_attempts += 1
+        else:
+            print(f"{attempt_str}: {format_seconds(startup_time)}")
+            measurements.append(startup_time)
+    return MeasurementsStats(measurements, failed_attempts)
+
+
+def check_imports(arguments: list[str]) -> bool:
+    """Print the heavy modules a scenario imports, True if it imports none."""
+    try:
+        heavy_imports = find_heavy_imports(arguments)
+    except subprocess.CalledProcessError as error:
+        print(f"  Import check: Error - {error}")
+        return False
+    if heavy_imports:
+        print(f"  Heavy imports: {', '.join(heavy_imports)}")
+    return not heavy_imports
+
+
+def run_scenario(scenario: str, count: int, budget: float) -> bool:
+    print(f"Scenario: bench {scenario}")
+    arguments = shlex.split(scenario)
+    measurements = measure_scenario(arguments, count)
+    print_measurement_results(measurements)
+    scenario_ok = (
+        check_imports(arguments)
+        and not measurements.failed_attempts  # noqa: W503
+        and measurements.median <= budget  # noqa: W503
+    )
+    print(f"  Within budget: {scenario_ok}")
+    print()
+    return scenario_ok
+
+
+def parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=STARTUP_DESCRIPTION)
+    configure_startup_arguments(parser)
+    return parser.parse_args()
+
+
+def run(args: argparse.Namespace) -> None:
+    print(f"Measuring cold start of {BENCH_SCRIPT}")
+    print(f"  Count: {args.count}")
+    print(f"  Budget: {format_seconds(args.budget)}")
+    print()
+
+    scenarios_ok = [
+        run_scenario(scenario, args.count, args.budget) for scenario in args.scenarios
+    ]
+    if not all(scenarios_ok):
+        exit(1)
+
+
+def main() -> None:
+    run(parse_arguments())
+
+
+if __name__ == "__main__":
+    main()